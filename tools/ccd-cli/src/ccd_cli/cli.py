@@ -9,7 +9,6 @@ import click
 import sys
 from pathlib import Path
 from rich.console import Console
-from rich.panel import Panel
 from rich.text import Text
 
 from .commands import (
@@ -51,6 +50,8 @@ console = Console()
 
 def print_banner():
     """Print CCD CLI banner."""
+    from rich.panel import Panel
+    
     banner = Text("CCD CLI", style="bold blue")
     subtitle = Text("Continuous Context Documentation", style="italic")
     
@@ -7,36 +7,87 @@ Commands for managing AI-CONTEXT comments in source code files.
 
 import click
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.syntax import Syntax
+import functools
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 import re
 import yaml
 from datetime import datetime, timezone
 
-console = Console()
+from ..utils.console import console
+from ..utils.fileio import read_bytes, write_atomic
+from ..utils.scan import PARALLEL_THRESHOLD, iter_source_files
+
+# Prefer the libyaml C bindings when available
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Pattern for AI-CONTEXT comments, anchored per line so a whole file can be
+# scanned in a single pass
+_AI_CONTEXT_RE = re.compile(r'(?m)^[ \t]*//?[ \t]*AI-CONTEXT:[ \t]*@(\w+):(.+)$')
+_AI_CONTEXT_BYTES_RE = re.compile(rb'(?m)^[ \t]*//?[ \t]*AI-CONTEXT:[ \t]*@(\w+):(.+)$')
+
+# Files above this size are scanned through mmap instead of being decoded
+MMAP_THRESHOLD = 64 * 1024
+
+# Comment style by file extension
+_EXT_STYLE = {ext: 'cpp' for ext in ('.go', '.js', '.ts', '.java', '.cs', '.cpp', '.c', '.rs')}
+_EXT_STYLE.update({ext: 'python' for ext in ('.py', '.sh', '.yaml', '.yml')})
+_EXT_STYLE.update({ext: 'html' for ext in ('.html', '.xml')})
+
+# Comment prefix by comment style
+_STYLE_PREFIX = {'cpp': '// ', 'python': '# ', 'html': '<!-- '}
+
+# AI-CONTEXT keys whose list values are emitted comma-separated
+_LIST_KEYS = frozenset(('dependencies', 'tags'))
+
+# Pattern for context card frontmatter
+_FRONTMATTER_RE = re.compile(rb'^---\r?\n(.*?)\r?\n---', re.DOTALL)
+
+# First line that is neither blank nor a comment
+_FIRST_CODE_RE = re.compile(r'(?m)^(?![^\S\n]*(?://|#|/\*|<!--|$)).+$')
+
+# Chunk size used when reading context card frontmatter
+FRONTMATTER_CHUNK_SIZE = 64 * 1024
+
+def _read_text_fast(file_path: Path) -> str:
+    """Read a UTF-8 text file with a single unbuffered read()."""
+    content = read_bytes(file_path).decode('utf-8')
+    
+    # Match read_text() universal newline handling
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    
+    return content
 
 def extract_ai_context_comments(file_path: Path) -> dict:
     """Extract AI-CONTEXT comments from a source file."""
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    content = file_path.read_text(encoding='utf-8')
-    comments = {}
+    if file_path.stat().st_size > MMAP_THRESHOLD:
+        return _extract_ai_context_comments_mmap(file_path)
     
-    # Pattern for AI-CONTEXT comments
-    pattern = r'//?\s*AI-CONTEXT:\s*@(\w+):(.+)'
+    content = _read_text_fast(file_path)
     
-    for line in content.split('\n'):
-        match = re.match(pattern, line.strip())
-        if match:
-            key = match.group(1)
-            value = match.group(2).strip()
-            comments[key] = value
+    # Most source files carry no comments at all; skip the regex for them
+    if 'AI-CONTEXT' not in content:
+        return {}
     
-    return comments
+    return {m.group(1): m.group(2).strip() for m in _AI_CONTEXT_RE.finditer(content)}
+
+def _extract_ai_context_comments_mmap(file_path: Path) -> dict:
+    """Extract AI-CONTEXT comments from a large file without decoding it."""
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if mm.find(b'AI-CONTEXT') == -1:
+                return {}
+            return {
+                m.group(1).decode('utf-8'): m.group(2).decode('utf-8').strip()
+                for m in _AI_CONTEXT_BYTES_RE.finditer(mm)
+            }
 
 def validate_ai_context_comments(file_path: Path) -> dict:
     """Validate AI-CONTEXT comments format and content."""
@@ -91,7 +142,7 @@ def add_ai_context_comments(file_path: Path, context_file: Path, force: bool = F
         raise FileNotFoundError(f"Context file not found: {context_file}")
     
     # Read source file
-    content = file_path.read_text(encoding='utf-8')
+    content = _read_text_fast(file_path)
     
     # Check if comments already exist
     if 'AI-CONTEXT:' in content and not force:
@@ -108,39 +159,51 @@ def add_ai_context_comments(file_path: Path, context_file: Path, force: bool = F
     # Format comments
     formatted_comments = format_ai_context_comments(comments, comment_style)
     
-    # Insert comments at the beginning of the file
-    lines = content.split('\n')
-    
-    # Find the first non-comment, non-empty line
-    insert_index = 0
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped and not stripped.startswith(('//', '#', '/*', '<!--')):
-            insert_index = i
-            break
-    
-    # Insert comments
-    lines.insert(insert_index, '')
-    lines.insert(insert_index, formatted_comments)
+    # Insert comments before the first non-comment, non-empty line
+    code_match = _FIRST_CODE_RE.search(content)
+    insert_offset = code_match.start() if code_match else 0
     
     # Write back to file
-    file_path.write_text('\n'.join(lines), encoding='utf-8')
+    write_atomic(
+        file_path,
+        (content[:insert_offset] + formatted_comments + '\n\n' + content[insert_offset:]).encode('utf-8')
+    )
     
     return True
 
-def generate_ai_context_comments(context_file: Path) -> dict:
-    """Generate AI-CONTEXT comments from a context card."""
-    content = context_file.read_text(encoding='utf-8')
+def _read_frontmatter(context_file: Path) -> bytes:
+    """Read just enough of a context card to return its raw frontmatter."""
+    content = b''
+    with open(context_file, 'rb') as f:
+        while True:
+            chunk = f.read(FRONTMATTER_CHUNK_SIZE)
+            content += chunk
+            
+            if not content.startswith(b'---'):
+                break
+            
+            frontmatter_match = _FRONTMATTER_RE.match(content)
+            if frontmatter_match:
+                return frontmatter_match.group(1)
+            
+            if not chunk:
+                break
     
-    # Parse frontmatter
-    frontmatter_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not frontmatter_match:
-        raise ValueError("Invalid context card format: missing frontmatter")
+    raise ValueError("Invalid context card format: missing frontmatter")
+
+@functools.lru_cache(maxsize=256)
+def _load_context_card(context_file: Path, mtime_ns: int) -> dict:
+    """Parse context card frontmatter, cached by path and modification time."""
+    frontmatter = _read_frontmatter(context_file)
     
     try:
-        metadata = yaml.safe_load(frontmatter_match.group(1))
+        return yaml.load(frontmatter, Loader=Loader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in context card: {e}")
+
+def generate_ai_context_comments(context_file: Path) -> dict:
+    """Generate AI-CONTEXT comments from a context card."""
+    metadata = _load_context_card(context_file, context_file.stat().st_mtime_ns)
     
     # Generate comments
     comments = {
@@ -158,43 +221,45 @@ def generate_ai_context_comments(context_file: Path) -> dict:
 
 def format_ai_context_comments(comments: dict, style: str) -> str:
     """Format AI-CONTEXT comments according to comment style."""
-    if style == 'cpp':
-        prefix = '// '
-    elif style == 'python':
-        prefix = '# '
-    elif style == 'html':
-        prefix = '<!-- '
-        suffix = ' -->'
-    else:
-        prefix = '// '
-        suffix = ''
+    prefix = _STYLE_PREFIX.get(style, '// ')
+    suffix = ' -->' if style == 'html' else ''
     
-    formatted = []
-    for key, value in comments.items():
-        if key == 'dependencies' and isinstance(value, list):
-            value = ','.join(value)
-        elif key == 'tags' and isinstance(value, list):
-            value = ','.join(value)
-        
-        if style == 'html':
-            formatted.append(f"{prefix}AI-CONTEXT: @{key}:{value}{suffix}")
-        else:
-            formatted.append(f"{prefix}AI-CONTEXT: @{key}:{value}")
+    items = (
+        (key, ','.join(value) if key in _LIST_KEYS and isinstance(value, list) else value)
+        for key, value in comments.items()
+    )
     
-    return '\n'.join(formatted)
+    return '\n'.join(f"{prefix}AI-CONTEXT: @{key}:{value}{suffix}" for key, value in items)
 
 def get_comment_style(file_path: Path) -> str:
     """Determine comment style based on file extension."""
-    ext = file_path.suffix.lower()
-    
-    if ext in ['.go', '.js', '.ts', '.java', '.cs', '.cpp', '.c', '.rs']:
-        return 'cpp'
-    elif ext in ['.py', '.sh', '.yaml', '.yml']:
-        return 'python'
-    elif ext in ['.html', '.xml']:
-        return 'html'
-    else:
-        return 'cpp'  # Default to C++ style
+    return _EXT_STYLE.get(file_path.suffix.lower(), 'cpp')  # Default to C++ style
+
+def find_source_files(project_dir: Path) -> list:
+    """Find source files that may carry AI-CONTEXT comments."""
+    return [Path(path) for path in sorted(iter_source_files(project_dir))]
+
+def _extract_file(file_path: Path) -> dict:
+    """Extract comments for a project-wide scan, skipping non-UTF-8 files."""
+    try:
+        return extract_ai_context_comments(file_path)
+    except UnicodeDecodeError:
+        return {}
+
+def _validate_file(file_path: Path) -> dict:
+    """Validate comments for a project-wide scan, skipping non-UTF-8 files."""
+    try:
+        return validate_ai_context_comments(file_path)
+    except UnicodeDecodeError:
+        return {'valid': True, 'errors': [], 'warnings': [], 'missing_required': [], 'comments': {}}
+
+def _map_files(func, paths: list) -> list:
+    """Run a per-file function, across a process pool for larger projects."""
+    if len(paths) <= PARALLEL_THRESHOLD:
+        return list(map(func, paths))
+    
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(func, paths, chunksize=64))
 
 @click.command()
 @click.option('--file', '-f', type=click.Path(exists=True), required=True, help='Source file path')
@@ -208,6 +273,8 @@ def add_context_comments(file, context, force, dry_run):
         context_file = Path(context)
         
         if dry_run:
+            from rich.syntax import Syntax
+            
             console.print(f"[blue]Dry run mode:[/blue] Would add AI-CONTEXT comments to {file_path}")
             comments = generate_ai_context_comments(context_file)
             comment_style = get_comment_style(file_path)
@@ -241,7 +308,8 @@ def extract_context(file, files, project, output):
             
             if output:
                 output_path = Path(output)
-                yaml.dump(comments, output_path.open('w'), default_flow_style=False)
+                with output_path.open('w') as f:
+                    yaml.dump(comments, f, Dumper=Dumper, default_flow_style=False)
                 console.print(f"[green]Comments extracted to {output_path}[/green]")
             else:
                 display_comments(file_path, comments)
@@ -251,8 +319,26 @@ def extract_context(file, files, project, output):
             console.print("[yellow]Glob pattern extraction not yet implemented[/yellow]")
             
         elif project:
-            # TODO: Implement project-wide extraction
-            console.print("[yellow]Project-wide extraction not yet implemented[/yellow]")
+            source_files = find_source_files(Path(project))
+            results = {
+                file_path: comments
+                for file_path, comments in zip(source_files, _map_files(_extract_file, source_files))
+                if comments
+            }
+            
+            if output:
+                output_path = Path(output)
+                with output_path.open('w') as f:
+                    yaml.dump_all(
+                        ({'path': str(path), **comments} for path, comments in results.items()),
+                        f, Dumper=Dumper, default_flow_style=False
+                    )
+                console.print(f"[green]Comments from {len(results)} files extracted to {output_path}[/green]")
+            elif results:
+                for file_path, comments in results.items():
+                    display_comments(file_path, comments)
+            else:
+                console.print("[yellow]No AI-CONTEXT comments found in project[/yellow]")
             
         else:
             console.print("[red]Error:[/red] Must specify --file, --files, or --project")
@@ -288,8 +374,28 @@ def validate_context_comments(file, files, project, strict, report):
             console.print("[yellow]Glob pattern validation not yet implemented[/yellow]")
             
         elif project:
-            # TODO: Implement project-wide validation
-            console.print("[yellow]Project-wide validation not yet implemented[/yellow]")
+            source_files = find_source_files(Path(project))
+            results = [
+                (file_path, validation)
+                for file_path, validation in zip(source_files, _map_files(_validate_file, source_files))
+                if validation['comments']
+            ]
+            
+            if not results:
+                console.print("[yellow]No AI-CONTEXT comments found in project[/yellow]")
+                return
+            
+            for file_path, validation in results:
+                if report:
+                    display_validation_report(file_path, validation)
+                else:
+                    display_validation_summary(file_path, validation)
+            
+            invalid_count = sum(1 for _, validation in results if not validation['valid'])
+            console.print(f"\n[blue]Summary:[/blue] {len(results) - invalid_count}/{len(results)} files have valid AI-CONTEXT comments")
+            
+            if strict and invalid_count:
+                raise click.Abort()
             
         else:
             console.print("[red]Error:[/red] Must specify --file, --files, or --project")
@@ -301,6 +407,8 @@ def validate_context_comments(file, files, project, strict, report):
 
 def display_comments(file_path: Path, comments: dict):
     """Display extracted comments in a table."""
+    from rich.table import Table
+    
     table = Table(title=f"AI-CONTEXT Comments in {file_path.name}")
     table.add_column("Field", style="cyan")
     table.add_column("Value", style="green")
@@ -326,6 +434,8 @@ def display_validation_summary(file_path: Path, validation: dict):
 
 def display_validation_report(file_path: Path, validation: dict):
     """Display detailed validation report."""
+    from rich.panel import Panel
+    
     panel = Panel(
         f"Validation Report for {file_path.name}\n\n"
         f"Status: {'Valid' if validation['valid'] else 'Invalid'}\n"
@@ -4,17 +4,39 @@ Health Command
 Check CCD project health and status.
 """
 
+import os
+from bisect import bisect_right
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.text import Text
 
 from ..core import CCDProject
+from ..utils.console import console
 from ..utils.errors import CCDError
+from ..utils.fileio import json_bytes
 
-console = Console()
+# CCD project indicators in the project root and its docs/ directory
+_ROOT_INDICATORS = frozenset(('ccd.config.yaml', '.ccd.yaml'))
+_DOCS_INDICATORS = frozenset(('CODEMAP.yaml', '00-manifest.md'))
+
+# Ascending metric thresholds and the labels for each band between them
+_SCORE_THRESHOLDS = (60, 80)
+_SCORE_COLORS = ("red", "yellow", "green")
+
+_COVERAGE_THRESHOLDS = (60, 80, 90)
+_FRESHNESS_THRESHOLDS = (70, 85, 95)
+_STATUS_LABELS = ("🔴 Poor", "🟠 Fair", "🟡 Good", "🟢 Excellent")
+
+_COVERAGE_DESCRIPTIONS = (
+    "Poor coverage - many files lack documentation",
+    "Fair coverage - some gaps in documentation",
+    "Good coverage - most important files documented",
+    "Excellent coverage - most files documented",
+)
+_FRESHNESS_DESCRIPTIONS = (
+    "Poor freshness - documentation is outdated",
+    "Fair freshness - some documentation may be stale",
+    "Good freshness - documentation is mostly current",
+    "Excellent freshness - documentation is current",
+)
 
 
 def health_command(ctx, detailed: bool, output_format: str):
@@ -33,6 +55,8 @@ def health_command(ctx, detailed: bool, output_format: str):
             raise CCDError("No CCD project found in current directory or parents")
         
         # Load project
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -77,18 +101,28 @@ def _find_ccd_project() -> Path:
 
 def _is_ccd_project(directory: Path) -> bool:
     """Check if directory is a CCD project."""
-    indicators = [
-        'docs/CODEMAP.yaml',
-        'docs/00-manifest.md',
-        'ccd.config.yaml',
-        '.ccd.yaml'
-    ]
+    # One directory listing per level instead of a stat per indicator
+    try:
+        entries = set(os.listdir(directory))
+    except OSError:
+        return False
+    
+    if not entries.isdisjoint(_ROOT_INDICATORS):
+        return True
     
-    return any((directory / indicator).exists() for indicator in indicators)
+    if 'docs' not in entries:
+        return False
+    
+    try:
+        return not _DOCS_INDICATORS.isdisjoint(os.listdir(directory / 'docs'))
+    except OSError:
+        return False
 
 
 def _display_health_text(health_report: dict, detailed: bool):
     """Display health report in text format."""
+    from rich.panel import Panel
+    from rich.table import Table
     
     # Overall health score
     score = health_report.get('health_score', 0)
@@ -151,6 +185,8 @@ def _display_health_text(health_report: dict, detailed: bool):
 
 def _display_detailed_health(health_report: dict):
     """Display detailed health information."""
+    from rich.table import Table
+    
     console.print("\n" + "="*60)
     console.print("[bold]Detailed Health Analysis[/bold]")
     console.print("="*60)
@@ -225,81 +261,41 @@ def _display_detailed_health(health_report: dict):
 
 def _display_health_json(health_report: dict):
     """Display health report in JSON format."""
-    import json
-    console.print(json.dumps(health_report, indent=2))
+    console.print(json_bytes(health_report).decode('utf-8'))
 
 
 def _display_health_yaml(health_report: dict):
     """Display health report in YAML format."""
     import yaml
-    console.print(yaml.dump(health_report, default_flow_style=False, sort_keys=False))
+    Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    console.print(yaml.dump(health_report, Dumper=Dumper, default_flow_style=False, sort_keys=False))
 
 
 def _get_score_color(score: float) -> str:
     """Get color for health score."""
-    if score >= 80:
-        return "green"
-    elif score >= 60:
-        return "yellow"
-    else:
-        return "red"
+    return _SCORE_COLORS[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 def _get_coverage_status(coverage: float) -> str:
     """Get status for coverage percentage."""
-    if coverage >= 90:
-        return "🟢 Excellent"
-    elif coverage >= 80:
-        return "🟡 Good"
-    elif coverage >= 60:
-        return "🟠 Fair"
-    else:
-        return "🔴 Poor"
+    return _STATUS_LABELS[bisect_right(_COVERAGE_THRESHOLDS, coverage)]
 
 
 def _get_freshness_status(freshness: float) -> str:
     """Get status for freshness percentage."""
-    if freshness >= 95:
-        return "🟢 Excellent"
-    elif freshness >= 85:
-        return "🟡 Good"
-    elif freshness >= 70:
-        return "🟠 Fair"
-    else:
-        return "🔴 Poor"
+    return _STATUS_LABELS[bisect_right(_FRESHNESS_THRESHOLDS, freshness)]
 
 
 def _get_quality_level(value: float) -> str:
     """Get quality level for a metric."""
-    if value >= 90:
-        return "🟢 Excellent"
-    elif value >= 80:
-        return "🟡 Good"
-    elif value >= 60:
-        return "🟠 Fair"
-    else:
-        return "🔴 Poor"
+    return _STATUS_LABELS[bisect_right(_COVERAGE_THRESHOLDS, value)]
 
 
 def _get_coverage_description(coverage: float) -> str:
     """Get description for coverage level."""
-    if coverage >= 90:
-        return "Excellent coverage - most files documented"
-    elif coverage >= 80:
-        return "Good coverage - most important files documented"
-    elif coverage >= 60:
-        return "Fair coverage - some gaps in documentation"
-    else:
-        return "Poor coverage - many files lack documentation"
+    return _COVERAGE_DESCRIPTIONS[bisect_right(_COVERAGE_THRESHOLDS, coverage)]
 
 
 def _get_freshness_description(freshness: float) -> str:
     """Get description for freshness level."""
-    if freshness >= 95:
-        return "Excellent freshness - documentation is current"
-    elif freshness >= 85:
-        return "Good freshness - documentation is mostly current"
-    elif freshness >= 70:
-        return "Fair freshness - some documentation may be stale"
-    else:
-        return "Poor freshness - documentation is outdated"
+    return _FRESHNESS_DESCRIPTIONS[bisect_right(_FRESHNESS_THRESHOLDS, freshness)]
@@ -4,18 +4,216 @@ Init Command
 Initialize a new CCD project.
 """
 
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
+from string import Template
 
 from ..core import CCDProject
+from ..utils.console import console
 from ..utils.errors import CCDError
 
-console = Console()
+# License choices offered when initializing a project
+LICENSES = ("MIT", "Apache-2.0", "GPL-3.0", "BSD-3-Clause", "Other")
+
+# Defaults for the project prompts (also used with --yes)
+_DEFAULT_TECHNOLOGY_STACK = "python,fastapi,sqlalchemy"
+_DEFAULT_LICENSE = "MIT"
+_DEFAULT_MAINTAINER_NAME = "Your Name"
+_DEFAULT_MAINTAINER_EMAIL = "your.email@example.com"
+
+# Files listed in the post-init structure view, and their colors
+_SHOWN_EXTENSIONS = frozenset(('.py', '.yaml', '.md', '.txt'))
+_EXT_COLOR = {
+    '.py': 'green',
+    '.yaml': 'yellow',
+    '.yml': 'yellow',
+    '.md': 'cyan',
+    '.txt': 'white'
+}
+
+# Threads used to write init's additional project files
+INIT_WRITE_WORKERS = 4
+
+# Static files written by init
+_GITIGNORE = b"""# Python
+__pycache__/
+*.py[cod]
+*$py.class
+*.so
+.Python
+build/
+develop-eggs/
+dist/
+downloads/
+eggs/
+.eggs/
+lib/
+lib64/
+parts/
+sdist/
+var/
+wheels/
+*.egg-info/
+.installed.cfg
+*.egg
+
+# Virtual environments
+.env
+.venv
+env/
+venv/
+ENV/
+env.bak/
+venv.bak/
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+*~
+
+# OS
+.DS_Store
+.DS_Store?
+._*
+.Spotlight-V100
+.Trashes
+ehthumbs.db
+Thumbs.db
+
+# CCD specific
+ccd-contexts.zip
+health-report.json
+coverage-report.yaml
+freshness-report.json
+"""
+
+_REQUIREMENTS = b"""# Core dependencies
+fastapi>=0.100.0
+uvicorn>=0.20.0
+sqlalchemy>=2.0.0
+pydantic>=2.0.0
+
+# Development dependencies
+pytest>=7.0.0
+pytest-asyncio>=0.21.0
+black>=23.0.0
+isort>=5.12.0
+flake8>=6.0.0
+mypy>=1.0.0
+
+# CCD CLI
+ccd-cli>=1.0.0
+"""
+
+_INIT_PY = b'"""CCD Project Source Code."""\n'
+
+# Templates for files that interpolate project details
+_CONFIG_TEMPLATE = Template("""# CCD Configuration
+project:
+  name: "$project_name"
+  domain: "$domain"
+  schemas_path: "./docs/schemas"
+  contexts_path: "./docs"
+
+generation:
+  auto_update: true
+  include_tests: false
+  include_docs: true
+
+validation:
+  strict_mode: true
+  fail_fast: false
+
+output:
+  default_format: "text"
+  colors: true
+  progress_bars: true
+""")
+
+_MAKEFILE_TEMPLATE = """# CCD Project Makefile
+
+.PHONY: help init generate validate health coverage pack clean
+
+help: ## Show this help message
+	@echo "CCD Project Management Commands:"
+	@grep -E '^[a-zA-Z_-]+:.*?## .*$$' $(MAKEFILE_LIST) | sort | awk 'BEGIN {{FS = ":.*?## "}}; {{printf "  \\033[36m%-15s\\033[0m %s\\n", $$1, $$2}}'
+
+init: ## Initialize CCD project (already done)
+	@echo "Project already initialized at {output_path}"
+
+generate: ## Generate context cards and documentation
+	ccd generate-cards --files "src/**/*.py" --output docs/context-cards/
+	ccd generate-index --modules "src/*" --output docs/modules/
+	ccd update-codemap --output docs/CODEMAP.yaml
+
+validate: ## Validate CCD contexts and schemas
+	ccd validate-contexts --contexts docs/ --schemas docs/schemas/
+
+health: ## Check project health
+	ccd health --detailed
+
+coverage: ## Show coverage statistics
+	ccd coverage --modules --files --min-coverage 80
+
+pack: ## Package contexts for distribution
+	ccd pack --output ./ccd-contexts.zip --include-schemas
+
+clean: ## Clean generated files
+	rm -rf docs/context-cards/
+	rm -rf docs/modules/
+	rm -f docs/CODEMAP.yaml
+	rm -f ccd-contexts.zip
+
+setup: ## Setup development environment
+	pip install -e .
+	pip install -r requirements.txt
+
+test: ## Run tests
+	pytest
+
+lint: ## Run linting
+	black .
+	isort .
+	flake8 .
+	mypy .
+
+format: ## Format code
+	black .
+	isort .
+"""
+
+_MAIN_TEMPLATE = Template("""\"\"\"
+$project_name - Main Application Entry Point
+
+This is the main entry point for the $project_name application.
+\"\"\"
+
+import uvicorn
+from fastapi import FastAPI
+
+app = FastAPI(
+    title="$project_name",
+    description="A $domain_label project using CCD methodology",
+    version="1.0.0"
+)
+
+@app.get("/")
+async def root():
+    \"\"\"Root endpoint.\"\"\"
+    return {"message": "Welcome to $project_name!"}
+
+@app.get("/health")
+async def health():
+    \"\"\"Health check endpoint.\"\"\"
+    return {"status": "healthy", "service": "$project_name"}
+
+if __name__ == "__main__":
+    uvicorn.run(app, host="0.0.0.0", port=8000)
+""")
 
 
 def init_command(ctx, project_name: str, domain: str, yes: bool, output_dir: str):
@@ -29,6 +227,15 @@ def init_command(ctx, project_name: str, domain: str, yes: bool, output_dir: str
         yes: Skip prompts and use defaults
         output_dir: Output directory
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.prompt import Confirm, Prompt
+    from rich.table import Table
+    
+    # Nobody can answer prompts when stdin is not a terminal (pipes, CI),
+    # so behave as if --yes was given
+    yes = yes or not sys.stdin.isatty()
+    
     try:
         # Validate inputs
         if not project_name or not domain:
@@ -48,16 +255,19 @@ def init_command(ctx, project_name: str, domain: str, yes: bool, output_dir: str
             border_style="blue"
         ))
         
+        # Defaults shared by the prompts and the non-interactive path
+        default_description = f"A {domain.replace('-', ' ')} project using CCD methodology"
+        
         # Get additional information if not skipping prompts
         if not yes:
             project_description = Prompt.ask(
                 "Project description",
-                default=f"A {domain.replace('-', ' ')} project using CCD methodology"
+                default=default_description
             )
             
             technology_stack = Prompt.ask(
                 "Technology stack (comma-separated)",
-                default="python,fastapi,sqlalchemy"
+                default=_DEFAULT_TECHNOLOGY_STACK
             ).split(",")
             
             repository_url = Prompt.ask(
@@ -72,36 +282,34 @@ def init_command(ctx, project_name: str, domain: str, yes: bool, output_dir: str
             
             license_type = Prompt.ask(
                 "License",
-                choices=["MIT", "Apache-2.0", "GPL-3.0", "BSD-3-Clause", "Other"],
-                default="MIT"
+                choices=LICENSES,
+                default=_DEFAULT_LICENSE
             )
             
             maintainer_name = Prompt.ask(
                 "Maintainer name",
-                default="Your Name"
+                default=_DEFAULT_MAINTAINER_NAME
             )
             
             maintainer_email = Prompt.ask(
                 "Maintainer email",
-                default="your.email@example.com"
+                default=_DEFAULT_MAINTAINER_EMAIL
             )
         else:
             # Use defaults
-            project_description = f"A {domain.replace('-', ' ')} project using CCD methodology"
-            technology_stack = ["python", "fastapi", "sqlalchemy"]
+            project_description = default_description
+            technology_stack = _DEFAULT_TECHNOLOGY_STACK.split(",")
             repository_url = ""
             website_url = ""
-            license_type = "MIT"
-            maintainer_name = "Your Name"
-            maintainer_email = "your.email@example.com"
+            license_type = _DEFAULT_LICENSE
+            maintainer_name = _DEFAULT_MAINTAINER_NAME
+            maintainer_email = _DEFAULT_MAINTAINER_EMAIL
         
         # Show what will be created
-        console.print("\n[bold]What will be created:[/bold]")
-        
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Component", style="cyan")
-        table.add_column("Description", style="white")
-        table.add_column("Path", style="green")
+        table = Table(show_header=True, header_style="ccd.header")
+        table.add_column("Component", style="ccd.component")
+        table.add_column("Description", style="ccd.description")
+        table.add_column("Path", style="ccd.path")
         
         table.add_row("Project Root", "Main project directory", str(output_path))
         table.add_row("README.md", "Project overview and CCD guide", str(output_path / "README.md"))
@@ -110,7 +318,7 @@ def init_command(ctx, project_name: str, domain: str, yes: bool, output_dir: str
         table.add_row("CODEMAP.yaml", "Repository-level context", str(output_path / "docs/CODEMAP.yaml"))
         table.add_row("GitHub Actions", "CI/CD workflows", str(output_path / ".github/workflows/"))
         
-        console.print(table)
+        console.print("\n[bold]What will be created:[/bold]", table)
         
         # Confirm creation
         if not yes:
@@ -156,8 +364,8 @@ def init_command(ctx, project_name: str, domain: str, yes: bool, output_dir: str
             
             progress.update(task, description="Finalizing...")
         
-        # Show success message
-        console.print("\n" + Panel(
+        # Show success message and project structure in a single render
+        success_panel = Panel(
             f"[bold green]✓ CCD Project Created Successfully![/bold green]\n\n"
             f"Your new CCD project is ready at:\n"
             f"[bold]{output_path.absolute()}[/bold]\n\n"
@@ -168,11 +376,14 @@ def init_command(ctx, project_name: str, domain: str, yes: bool, output_dir: str
             f"4. [bold]ccd validate-contexts[/bold] to check quality",
             title="Success!",
             border_style="green"
-        ))
-        
-        # Show project structure
-        console.print("\n[bold]Project Structure:[/bold]")
-        _show_project_structure(output_path)
+        )
+        console.print(
+            "",
+            success_panel,
+            "\n[bold]Project Structure:[/bold]",
+            _build_project_tree(output_path),
+            sep="\n"
+        )
         
     except Exception as e:
         raise CCDError(f"Failed to initialize project: {str(e)}")
@@ -181,233 +392,49 @@ def init_command(ctx, project_name: str, domain: str, yes: bool, output_dir: str
 def _create_additional_files(output_path: Path, project_name: str, domain: str):
     """Create additional project files."""
     
-    # Create .gitignore
-    gitignore_content = """# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-build/
-develop-eggs/
-dist/
-downloads/
-eggs/
-.eggs/
-lib/
-lib64/
-parts/
-sdist/
-var/
-wheels/
-*.egg-info/
-.installed.cfg
-*.egg
-
-# Virtual environments
-.env
-.venv
-env/
-venv/
-ENV/
-env.bak/
-venv.bak/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# OS
-.DS_Store
-.DS_Store?
-._*
-.Spotlight-V100
-.Trashes
-ehthumbs.db
-Thumbs.db
-
-# CCD specific
-ccd-contexts.zip
-health-report.json
-coverage-report.yaml
-freshness-report.json
-"""
-    
-    with open(output_path / ".gitignore", "w") as f:
-        f.write(gitignore_content)
-    
-    # Create CCD configuration
-    config_content = f"""# CCD Configuration
-project:
-  name: "{project_name}"
-  domain: "{domain}"
-  schemas_path: "./docs/schemas"
-  contexts_path: "./docs"
-
-generation:
-  auto_update: true
-  include_tests: false
-  include_docs: true
-
-validation:
-  strict_mode: true
-  fail_fast: false
-
-output:
-  default_format: "text"
-  colors: true
-  progress_bars: true
-"""
-    
-    with open(output_path / "ccd.config.yaml", "w") as f:
-        f.write(config_content)
-    
-    # Create Makefile
-    makefile_content = f"""# CCD Project Makefile
-
-.PHONY: help init generate validate health coverage pack clean
-
-help: ## Show this help message
-	@echo "CCD Project Management Commands:"
-	@grep -E '^[a-zA-Z_-]+:.*?## .*$$' $(MAKEFILE_LIST) | sort | awk 'BEGIN {{FS = ":.*?## "}}; {{printf "  \\033[36m%-15s\\033[0m %s\\n", $$1, $$2}}'
-
-init: ## Initialize CCD project (already done)
-	@echo "Project already initialized at {output_path}"
-
-generate: ## Generate context cards and documentation
-	ccd generate-cards --files "src/**/*.py" --output docs/context-cards/
-	ccd generate-index --modules "src/*" --output docs/modules/
-	ccd update-codemap --output docs/CODEMAP.yaml
-
-validate: ## Validate CCD contexts and schemas
-	ccd validate-contexts --contexts docs/ --schemas docs/schemas/
-
-health: ## Check project health
-	ccd health --detailed
-
-coverage: ## Show coverage statistics
-	ccd coverage --modules --files --min-coverage 80
-
-pack: ## Package contexts for distribution
-	ccd pack --output ./ccd-contexts.zip --include-schemas
-
-clean: ## Clean generated files
-	rm -rf docs/context-cards/
-	rm -rf docs/modules/
-	rm -f docs/CODEMAP.yaml
-	rm -f ccd-contexts.zip
-
-setup: ## Setup development environment
-	pip install -e .
-	pip install -r requirements.txt
-
-test: ## Run tests
-	pytest
-
-lint: ## Run linting
-	black .
-	isort .
-	flake8 .
-	mypy .
-
-format: ## Format code
-	black .
-	isort .
-"""
-    
-    with open(output_path / "Makefile", "w") as f:
-        f.write(makefile_content)
-    
-    # Create requirements.txt
-    requirements_content = """# Core dependencies
-fastapi>=0.100.0
-uvicorn>=0.20.0
-sqlalchemy>=2.0.0
-pydantic>=2.0.0
-
-# Development dependencies
-pytest>=7.0.0
-pytest-asyncio>=0.21.0
-black>=23.0.0
-isort>=5.12.0
-flake8>=6.0.0
-mypy>=1.0.0
-
-# CCD CLI
-ccd-cli>=1.0.0
-"""
-    
-    with open(output_path / "requirements.txt", "w") as f:
-        f.write(requirements_content)
-    
     # Create sample source structure
     src_path = output_path / "src"
-    src_path.mkdir(exist_ok=True)
+    src_path.mkdir(parents=True, exist_ok=True)
     
-    # Create __init__.py
-    with open(src_path / "__init__.py", "w") as f:
-        f.write('"""CCD Project Source Code."""\n')
+    files = {
+        output_path / ".gitignore": _GITIGNORE,
+        output_path / "ccd.config.yaml": _CONFIG_TEMPLATE.substitute(
+            project_name=project_name, domain=domain
+        ).encode('utf-8'),
+        output_path / "Makefile": _MAKEFILE_TEMPLATE.format(output_path=output_path).encode('utf-8'),
+        output_path / "requirements.txt": _REQUIREMENTS,
+        src_path / "__init__.py": _INIT_PY,
+        src_path / "main.py": _MAIN_TEMPLATE.substitute(
+            project_name=project_name, domain_label=domain.replace('-', ' ')
+        ).encode('utf-8'),
+    }
     
-    # Create main.py
-    main_content = f"""\"\"\"
-{project_name} - Main Application Entry Point
+    # Every target is a distinct file in an existing directory, so the
+    # writes can overlap on slow or network filesystems
+    with ThreadPoolExecutor(max_workers=INIT_WRITE_WORKERS) as executor:
+        list(executor.map(Path.write_bytes, files.keys(), files.values()))
 
-This is the main entry point for the {project_name} application.
-\"\"\"
 
-import uvicorn
-from fastapi import FastAPI
-
-app = FastAPI(
-    title="{project_name}",
-    description="A {domain.replace('-', ' ')} project using CCD methodology",
-    version="1.0.0"
-)
-
-@app.get("/")
-async def root():
-    \"\"\"Root endpoint.\"\"\"
-    return {{"message": "Welcome to {project_name}!"}}
-
-@app.get("/health")
-async def health():
-    \"\"\"Health check endpoint.\"\"\"
-    return {{"status": "healthy", "service": "{project_name}"}}
-
-if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-"""
-    
-    with open(src_path / "main.py", "w") as f:
-        f.write(main_content)
-
-
-def _show_project_structure(output_path: Path, prefix: str = ""):
-    """Show the created project structure."""
+def _build_project_tree(output_path: Path):
+    """Build a tree of the created project structure."""
+    from rich.tree import Tree
     
-    def _show_dir(path: Path, prefix: str, is_last: bool):
-        console.print(f"{prefix}{'└── ' if is_last else '├── '}[blue]{path.name}/[/blue]")
-        
-        items = sorted([item for item in path.iterdir() if item.is_dir() or item.suffix in ['.py', '.yaml', '.md', '.txt']])
+    def _add_dir(node, path):
+        with os.scandir(path) as it:
+            items = sorted(
+                (entry for entry in it
+                 if entry.is_dir(follow_symlinks=False)
+                 or os.path.splitext(entry.name)[1] in _SHOWN_EXTENSIONS),
+                key=lambda entry: entry.name
+            )
         
-        for i, item in enumerate(items):
-            is_last_item = i == len(items) - 1
-            new_prefix = prefix + ('    ' if is_last else '│   ')
-            
-            if item.is_dir():
-                _show_dir(item, new_prefix, is_last_item)
+        for item in items:
+            if item.is_dir(follow_symlinks=False):
+                _add_dir(node.add(f"[blue]{item.name}/[/blue]"), item.path)
             else:
-                color = {
-                    '.py': 'green',
-                    '.yaml': 'yellow', 
-                    '.yml': 'yellow',
-                    '.md': 'cyan',
-                    '.txt': 'white'
-                }.get(item.suffix, 'white')
-                
-                console.print(f"{new_prefix}{'└── ' if is_last_item else '├── '}[{color}]{item.name}[/{color}]")
+                color = _EXT_COLOR.get(os.path.splitext(item.name)[1], 'white')
+                node.add(f"[{color}]{item.name}[/{color}]")
     
-    _show_dir(output_path, "", True)
+    tree = Tree(f"[blue]{output_path.name}/[/blue]")
+    _add_dir(tree, output_path)
+    return tree
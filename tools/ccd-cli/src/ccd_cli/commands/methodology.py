@@ -7,31 +7,34 @@ Commands for managing the CCD methodology loop including roadmap, engineering lo
 
 import click
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.syntax import Syntax
-import yaml
-from datetime import datetime, timezone
+from datetime import date
+import os
 import re
+import shutil
+import tempfile
+import time
 
-console = Console()
+from ..utils.console import console
+from ..utils.fileio import read_bytes, write_atomic
 
-def update_engineering_log(log_file: Path, description: str, impact: str = "Medium", 
-                         severity: str = "Medium", technical_changes: str = "", 
-                         resolution: str = "", lessons_learned: str = "", 
-                         follow_up: str = "") -> bool:
-    """Update ENGINEERING_LOG.md with a new entry."""
-    if not log_file.exists():
-        # Create new engineering log file
-        create_engineering_log(log_file)
-    
-    content = log_file.read_text(encoding='utf-8')
-    
-    # Generate new entry
-    timestamp = datetime.now().strftime("%Y-%m-%d")
-    entry = f"""
+# Roadmap checkbox line: list marker, check mark, and the milestone text
+_ROADMAP_LINE_RE = re.compile(r'^(\s*[-*]\s*)\[([ x])\]([^\r\n]*)', re.IGNORECASE)
+
+# Engineering log entry heading, e.g. "## 2024-01-01 - Description"
+_LOG_ENTRY_RE = re.compile(rb'^##(?= ).* - ')
+
+# Buffer size used when copying the remainder of the engineering log
+LOG_COPY_BUFFER_SIZE = 64 * 1024
+
+# ADR file name: zero-padded number, then the slugified title
+_ADR_RE = re.compile(r'^(\d{3,})-.*\.md$')
+
+# Placeholders used for engineering log sections left empty
+_LIST_PLACEHOLDER = "- [To be filled]"
+_TASK_PLACEHOLDER = "- [ ] [To be filled]"
+
+# Engineering log entry, inserted above the most recent entry
+_LOG_ENTRY_TEMPLATE = """
 ---
 
 ## {timestamp} - {description}
@@ -46,43 +49,24 @@ def update_engineering_log(log_file: Path, description: str, impact: str = "Medi
 - **Business Impact**: [To be filled]
 
 ### Technical Changes
-{technical_changes if technical_changes else "- [To be filled]"}
+{technical_changes}
 
 ### Resolution
-{resolution if resolution else "- [To be filled]"}
+{resolution}
 
 ### Lessons Learned
-{lessons_learned if lessons_learned else "- [To be filled]"}
+{lessons_learned}
 
 ### Follow-up Actions
-{follow_up if follow_up else "- [ ] [To be filled]"}
+{follow_up}
 """
-    
-    # Insert at the beginning after the title
-    lines = content.split('\n')
-    insert_index = 0
-    
-    # Find the first entry (after title and description)
-    for i, line in enumerate(lines):
-        if line.startswith('## ') and ' - ' in line:
-            insert_index = i
-            break
-    
-    # Insert new entry
-    lines.insert(insert_index, entry)
-    
-    # Write back to file
-    log_file.write_text('\n'.join(lines), encoding='utf-8')
-    
-    return True
 
-def create_engineering_log(log_file: Path):
-    """Create a new engineering log file with template."""
-    template = f"""# CCD Engineering Log
+# Initial engineering log contents
+_LOG_TEMPLATE = """# CCD Engineering Log
 
 This file tracks technical decisions, incidents, and lessons learned during the development of this project.
 
-## {datetime.now().strftime("%Y-%m-%d")} - Engineering Log Created
+## {timestamp} - Engineering Log Created
 
 ### Description
 Initial engineering log creation for CCD methodology implementation.
@@ -112,6 +96,130 @@ Initial engineering log creation for CCD methodology implementation.
 
 ---
 """
+
+# Placeholders used for ADR sections left empty
+_ADR_CONTEXT_PLACEHOLDER = "[To be filled - Describe the forces at play, including technological, political, social, and project local. These forces are probably in tension, and should be called out as such. The language in this section is value-neutral. It is simply describing facts.]"
+_ADR_DECISION_PLACEHOLDER = "[To be filled - Describe our response to these forces. It is stated in full sentences, with active voice. 'We will...']"
+_ADR_CONSEQUENCES_PLACEHOLDER = "[To be filled - Describe the resulting context, after applying the decision. All consequences should be listed here, not just the 'positive' ones. A particular decision may have positive, negative, and neutral consequences, but all of them are implications of the decision.]"
+
+# Architecture Decision Record contents
+_ADR_TEMPLATE = """# [ADR-{number:03d}] {title}
+
+## Status
+**{status}** - {title}
+
+## Context
+
+{context}
+
+## Decision
+
+{decision}
+
+## Consequences
+
+{consequences}
+
+## Alternatives Considered
+
+[To be filled - List the alternatives that were considered, and why they were not chosen. This section is optional, but it's good practice to document alternatives that were considered.]
+
+## Implementation Notes
+
+[To be filled - Any notes about the implementation of this decision.]
+
+## Related Decisions
+
+[To be filled - Links to related ADRs or other documentation.]
+
+---
+
+**Date**: {timestamp}  
+**Author**: [To be filled]  
+**Reviewers**: [To be filled]  
+**Status**: {status}
+"""
+
+# Placeholders used for workflow pattern sections left empty
+_RULE_CONTEXT_PLACEHOLDER = "[To be filled - When to use this pattern]"
+_RULE_STEPS_PLACEHOLDER = "1. [Step 1]\n2. [Step 2]\n3. [Step 3]"
+_RULE_VALIDATION_PLACEHOLDER = "- [ ] [Validation requirement 1]\n- [ ] [Validation requirement 2]"
+
+# Workflow pattern appended to the development rules
+_RULE_TEMPLATE = """
+
+## New Workflow Pattern - {timestamp}
+
+### Context
+{context}
+
+### Steps
+{steps}
+
+### Validation
+{validation}
+
+---
+"""
+
+def update_engineering_log(log_file: Path, description: str, impact: str = "Medium", 
+                         severity: str = "Medium", technical_changes: str = "", 
+                         resolution: str = "", lessons_learned: str = "", 
+                         follow_up: str = "") -> bool:
+    """Update ENGINEERING_LOG.md with a new entry."""
+    if not log_file.exists():
+        # Create new engineering log file
+        create_engineering_log(log_file)
+    
+    # Generate new entry
+    timestamp = date.today().isoformat()
+    entry = _LOG_ENTRY_TEMPLATE.format_map({
+        'timestamp': timestamp,
+        'description': description,
+        'impact': impact,
+        'severity': severity,
+        'technical_changes': technical_changes or _LIST_PLACEHOLDER,
+        'resolution': resolution or _LIST_PLACEHOLDER,
+        'lessons_learned': lessons_learned or _LIST_PLACEHOLDER,
+        'follow_up': follow_up or _TASK_PLACEHOLDER,
+    })
+    
+    # Stream the log into a sibling temp file, inserting the entry before
+    # the first existing entry (or at the top when there is none)
+    entry_bytes = entry.encode('utf-8') + b'\n'
+    with open(log_file, 'rb') as src, tempfile.NamedTemporaryFile(
+        'wb', dir=log_file.parent, prefix=f".{log_file.name}.", delete=False
+    ) as dst:
+        try:
+            for line in src:
+                if _LOG_ENTRY_RE.match(line):
+                    dst.write(entry_bytes)
+                    dst.write(line)
+                    shutil.copyfileobj(src, dst, LOG_COPY_BUFFER_SIZE)
+                    break
+                dst.write(line)
+            else:
+                dst.seek(0)
+                dst.truncate()
+                dst.write(entry_bytes)
+                src.seek(0)
+                shutil.copyfileobj(src, dst, LOG_COPY_BUFFER_SIZE)
+            dst.flush()
+            os.fsync(dst.fileno())
+        except BaseException:
+            dst.close()
+            os.unlink(dst.name)
+            raise
+    
+    shutil.copymode(log_file, dst.name)
+    os.replace(dst.name, log_file)
+    
+    return True
+
+def create_engineering_log(log_file: Path):
+    """Create a new engineering log file with template."""
+    timestamp = date.today().isoformat()
+    template = _LOG_TEMPLATE.format_map({'timestamp': timestamp})
     log_file.write_text(template, encoding='utf-8')
 
 def update_roadmap(roadmap_file: Path, milestone: str, status: str = "completed", 
@@ -121,36 +229,42 @@ def update_roadmap(roadmap_file: Path, milestone: str, status: str = "completed"
         console.print(f"[red]Error:[/red] Roadmap file not found: {roadmap_file}")
         return False
     
-    content = roadmap_file.read_text(encoding='utf-8')
+    content = read_bytes(roadmap_file).decode('utf-8')
     
     # Find and update milestone
-    lines = content.split('\n')
+    lines = content.splitlines(keepends=True)
+    needle = milestone.lower()
     updated = False
     
     for i, line in enumerate(lines):
-        if milestone.lower() in line.lower() and '[' in line and ']' in line:
-            if status == "completed":
-                # Mark as completed
-                new_line = line.replace('[ ]', '[x]').replace('[ ]', '[x]')
-                if '✅' not in new_line:
-                    new_line += ' ✅'
-            elif status == "in_progress":
-                # Mark as in progress
-                new_line = line.replace('[x]', '[ ]').replace('[x]', '[ ]')
-                if '🔄' not in new_line:
-                    new_line += ' 🔄'
-            else:
-                new_line = line
-            
-            if notes:
-                new_line += f" - {notes}"
-            
-            lines[i] = new_line
-            updated = True
-            break
+        match = _ROADMAP_LINE_RE.match(line)
+        if match is None or needle not in match.group(3).lower():
+            continue
+        
+        prefix, mark, tail = match.groups()
+        if status == "completed":
+            # Mark as completed
+            mark = 'x'
+            suffix = '' if '✅' in tail else ' ✅'
+        elif status == "in_progress":
+            # Mark as in progress
+            mark = ' '
+            suffix = '' if '🔄' in tail else ' 🔄'
+        else:
+            suffix = ''
+        
+        if notes:
+            suffix += f" - {notes}"
+        
+        new_line = ''.join((prefix, '[', mark, ']', tail, suffix, line[match.end():]))
+        changed = new_line != line
+        lines[i] = new_line
+        updated = True
+        break
     
     if updated:
-        roadmap_file.write_text('\n'.join(lines), encoding='utf-8')
+        if changed:
+            write_atomic(roadmap_file, ''.join(lines).encode('utf-8'))
         console.print(f"[green]Successfully updated roadmap milestone: {milestone}[/green]")
         return True
     else:
@@ -164,59 +278,28 @@ def create_adr(decisions_dir: Path, title: str, status: str = "Proposed",
         decisions_dir.mkdir(parents=True, exist_ok=True)
     
     # Find next ADR number
-    existing_adrs = list(decisions_dir.glob("*.md"))
-    next_number = 1
-    
-    for adr_file in existing_adrs:
-        if adr_file.name.startswith("00"):
-            try:
-                num = int(adr_file.name.split("-")[0])
-                next_number = max(next_number, num + 1)
-            except ValueError:
-                continue
+    with os.scandir(decisions_dir) as it:
+        next_number = 1 + max(
+            (int(match.group(1)) for entry in it
+             if (match := _ADR_RE.match(entry.name)) and entry.is_file()),
+            default=0
+        )
     
     # Create ADR filename
     filename = f"{next_number:03d}-{title.lower().replace(' ', '-')}.md"
     adr_file = decisions_dir / filename
     
     # Generate ADR content
-    timestamp = datetime.now().strftime("%Y-%m-%d")
-    adr_content = f"""# [ADR-{next_number:03d}] {title}
-
-## Status
-**{status}** - {title}
-
-## Context
-
-{context if context else "[To be filled - Describe the forces at play, including technological, political, social, and project local. These forces are probably in tension, and should be called out as such. The language in this section is value-neutral. It is simply describing facts.]"}
-
-## Decision
-
-{decision if decision else "[To be filled - Describe our response to these forces. It is stated in full sentences, with active voice. 'We will...']"}
-
-## Consequences
-
-{consequences if consequences else "[To be filled - Describe the resulting context, after applying the decision. All consequences should be listed here, not just the 'positive' ones. A particular decision may have positive, negative, and neutral consequences, but all of them are implications of the decision.]"}
-
-## Alternatives Considered
-
-[To be filled - List the alternatives that were considered, and why they were not chosen. This section is optional, but it's good practice to document alternatives that were considered.]
-
-## Implementation Notes
-
-[To be filled - Any notes about the implementation of this decision.]
-
-## Related Decisions
-
-[To be filled - Links to related ADRs or other documentation.]
-
----
-
-**Date**: {timestamp}  
-**Author**: [To be filled]  
-**Reviewers**: [To be filled]  
-**Status**: {status}
-"""
+    timestamp = date.today().isoformat()
+    adr_content = _ADR_TEMPLATE.format_map({
+        'number': next_number,
+        'title': title,
+        'status': status,
+        'timestamp': timestamp,
+        'context': context or _ADR_CONTEXT_PLACEHOLDER,
+        'decision': decision or _ADR_DECISION_PLACEHOLDER,
+        'consequences': consequences or _ADR_CONSEQUENCES_PLACEHOLDER,
+    })
     
     adr_file.write_text(adr_content, encoding='utf-8')
     console.print(f"[green]Successfully created ADR: {adr_file.name}[/green]")
@@ -229,33 +312,18 @@ def update_development_rules(rules_file: Path, new_rule: str, context: str = "",
         console.print(f"[red]Error:[/red] Development rules file not found: {rules_file}")
         return False
     
-    content = rules_file.read_text(encoding='utf-8')
-    
-    # Find the end of the file to append new rule
-    lines = content.split('\n')
-    
     # Generate new rule content
-    timestamp = datetime.now().strftime("%Y-%m-%d")
-    new_rule_content = f"""
-
-## New Workflow Pattern - {timestamp}
-
-### Context
-{context if context else "[To be filled - When to use this pattern]"}
-
-### Steps
-{steps if steps else "1. [Step 1]\n2. [Step 2]\n3. [Step 3]"}
-
-### Validation
-{validation if validation else "- [ ] [Validation requirement 1]\n- [ ] [Validation requirement 2]"}
-
----
-"""
-    
-    # Append to the end
-    lines.extend(new_rule_content.split('\n'))
+    timestamp = date.today().isoformat()
+    new_rule_content = _RULE_TEMPLATE.format_map({
+        'timestamp': timestamp,
+        'context': context or _RULE_CONTEXT_PLACEHOLDER,
+        'steps': steps or _RULE_STEPS_PLACEHOLDER,
+        'validation': validation or _RULE_VALIDATION_PLACEHOLDER,
+    })
     
-    rules_file.write_text('\n'.join(lines), encoding='utf-8')
+    # Append to the end without reading the existing rules back in
+    with open(rules_file, 'ab') as f:
+        f.write(b'\n' + new_rule_content.encode('utf-8'))
     console.print(f"[green]Successfully added new workflow pattern to development rules[/green]")
     return True
 
@@ -357,53 +425,64 @@ def update_development_rules_cmd(rules_file, new_rule, context, steps, validatio
               help='Project directory to analyze')
 def methodology_status(project_dir):
     """Show status of all methodological files in the project."""
+    from rich.table import Table
+    
     try:
         project_path = Path(project_dir)
         
+        docs_path = project_path / "docs"
+        
         # Check for methodological files
         files_to_check = [
-            ('ENGINEERING_LOG.md', 'docs/ENGINEERING_LOG.md'),
-            ('roadmap.md', 'docs/roadmap.md'),
-            ('DEVELOPMENT_RULES.md', 'docs/DEVELOPMENT_RULES.md'),
-            ('decisions/', 'docs/decisions/')
+            ('ENGINEERING_LOG.md', 'ENGINEERING_LOG.md'),
+            ('roadmap.md', 'roadmap.md'),
+            ('DEVELOPMENT_RULES.md', 'DEVELOPMENT_RULES.md'),
+            ('decisions/', 'decisions')
         ]
         
+        # Read the docs directory once and reuse the cached entries
+        try:
+            with os.scandir(docs_path) as it:
+                docs_entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            docs_entries = {}
+        
         table = Table(title="CCD Methodology Status")
         table.add_column("File", style="cyan")
         table.add_column("Status", style="green")
         table.add_column("Last Updated", style="yellow")
         table.add_column("Notes", style="blue")
         
-        for name, path in files_to_check:
-            file_path = project_path / path
+        now = time.time()
+        for name, entry_name in files_to_check:
+            entry = docs_entries.get(entry_name)
             
-            if file_path.exists():
-                if file_path.is_file():
-                    # Get last modified time
-                    mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    last_updated = mtime.strftime("%Y-%m-%d")
-                    
-                    # Check if recently updated (within 7 days)
-                    days_old = (datetime.now() - mtime).days
-                    if days_old <= 7:
-                        status = "✅ Current"
-                    elif days_old <= 30:
-                        status = "🟡 Recent"
-                    else:
-                        status = "🔴 Outdated"
-                    
-                    table.add_row(name, status, last_updated, f"Updated {days_old} days ago")
+            if entry is not None and entry.is_file():
+                # Get last modified time
+                mtime = entry.stat().st_mtime
+                last_updated = time.strftime("%Y-%m-%d", time.localtime(mtime))
+                
+                # Check if recently updated (within 7 days)
+                days_old = int((now - mtime) // 86400)
+                if days_old <= 7:
+                    status = "✅ Current"
+                elif days_old <= 30:
+                    status = "🟡 Recent"
+                else:
+                    status = "🔴 Outdated"
+                
+                table.add_row(name, status, last_updated, f"Updated {days_old} days ago")
+            elif entry is not None and entry.is_dir():
+                # Directory
+                with os.scandir(entry.path) as it:
+                    adr_files = [adr for adr in it if adr.name.endswith(".md")]
+                if adr_files:
+                    latest_adr = max(adr_files, key=lambda adr: adr.stat().st_mtime)
+                    last_updated = time.strftime("%Y-%m-%d", time.localtime(latest_adr.stat().st_mtime))
+                    status = f"✅ {len(adr_files)} ADRs"
+                    table.add_row(name, status, last_updated, f"Latest: {latest_adr.name}")
                 else:
-                    # Directory
-                    adr_files = list(file_path.glob("*.md"))
-                    if adr_files:
-                        latest_adr = max(adr_files, key=lambda f: f.stat().st_mtime)
-                        mtime = datetime.fromtimestamp(latest_adr.stat().st_mtime)
-                        last_updated = mtime.strftime("%Y-%m-%d")
-                        status = f"✅ {len(adr_files)} ADRs"
-                        table.add_row(name, status, last_updated, f"Latest: {latest_adr.name}")
-                    else:
-                        table.add_row(name, "🟡 Empty", "N/A", "No ADRs found")
+                    table.add_row(name, "🟡 Empty", "N/A", "No ADRs found")
             else:
                 table.add_row(name, "🔴 Missing", "N/A", "File not found")
         
@@ -4,9 +4,7 @@ Monitor Command
 Monitor CCD project status.
 """
 
-from rich.console import Console
-
-console = Console()
+from ..utils.console import console
 
 
 def monitor_command(ctx, watch: bool, interval: int, output_format: str):
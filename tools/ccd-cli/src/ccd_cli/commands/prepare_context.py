@@ -8,10 +8,6 @@ Command for preparing complete project context for AI developers
 import click
 from pathlib import Path
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.syntax import Syntax
-from rich.table import Table
 import yaml
 from datetime import datetime
 import subprocess
@@ -6,22 +6,103 @@ Commands for managing quality gates, context freshness, and drift detection.
 """
 
 import click
+import functools
+import itertools
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
 import yaml
 from datetime import datetime, timezone, timedelta
 import json
+import mmap
+import os
 import re
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+from ..utils.fileio import json_bytes, read_bytes
+from ..utils.scan import IGNORED_DIRS, PARALLEL_THRESHOLD, SOURCE_EXTENSIONS
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional speedup
+    re2 = None
 
 console = Console()
 
-def check_context_freshness(context_file: Path, threshold_hours: int = 24) -> dict:
-    """Check context freshness against threshold."""
-    if not context_file.exists():
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _FrontmatterLoader(Loader):
+    """Loader for card frontmatter that keeps dates and timestamps as strings."""
+
+
+# JSON schemas describe dates as strings, so the timestamp resolver is dropped
+_FrontmatterLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag != 'tag:yaml.org,2002:timestamp']
+    for first, resolvers in Loader.yaml_implicit_resolvers.items()
+}
+
+# Context cards older than this many hours are no longer fresh
+FRESHNESS_THRESHOLD_HOURS = 24
+
+# Suffix identifying context card files
+CONTEXT_SUFFIX = '.ctx.md'
+
+# Sections every context card should have, with the factor reported when missing
+_REQUIRED_SECTIONS = tuple(
+    (section.encode('utf-8'), f'missing_section_{section[3:].lower()}')
+    for section in ('## Overview', '## Purpose', '## Dependencies', '## Key Components')
+)
+
+# Quoted file_path entry in a context card's frontmatter, compiled with
+# RE2's linear-time engine when google-re2 is installed
+_FILE_PATH_RE = (re2 or re).compile(rb'file_path:\s*["\']([^"\']+)["\']')
+
+# Context cards above this size are scanned through mmap, so only the pages
+# up to each marker are read instead of the whole file
+CONTEXT_MMAP_THRESHOLD = 64 * 1024
+
+# Leading window searched for file_path before falling back to the whole card
+CONTEXT_HEADER_WINDOW = 8 * 1024
+
+# Line counting stops here; the health check treats all longer cards alike
+_MAX_COUNTED_LINES = 201
+
+# Schema that context card frontmatter is validated against, relative to
+# the project root
+CONTEXT_CARD_SCHEMA = Path('docs') / 'schemas' / 'context-card.schema.json'
+
+# Ascending gate thresholds; the score and status for each band between them
+_GATE_SCORES = (30, 60, 80, 100)
+_GATE_STATUSES = ('poor', 'fair', 'good', 'excellent')
+
+_COVERAGE_THRESHOLDS = (50, 75, 90)
+_FRESHNESS_THRESHOLDS = (60, 80, 95)
+_HEALTH_THRESHOLDS = (50, 70, 85)
+_SCHEMA_THRESHOLDS = (60, 80, 95)
+
+# Threads used to walk top-level subdirectories of a project
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Threads running per-file checks (file reads plus stats) once a project has
+# more than PARALLEL_THRESHOLD context files
+CHECK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _age_hours(mtime: float) -> float:
+    """Hours elapsed since an epoch timestamp."""
+    return (time.time() - mtime) / 3600
+
+def check_context_freshness(context_file: Path, threshold_hours: int = FRESHNESS_THRESHOLD_HOURS,
+                            mtime: float = None) -> dict:
+    """Check context freshness against threshold, reusing mtime when given."""
+    if mtime is None:
+        try:
+            mtime = context_file.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+    
+    if mtime is None:
         return {
             'fresh': False,
             'age_hours': None,
@@ -30,11 +111,7 @@ def check_context_freshness(context_file: Path, threshold_hours: int = 24) -> di
             'last_updated': None
         }
     
-    # Get file modification time
-    mtime = datetime.fromtimestamp(context_file.stat().st_mtime)
-    now = datetime.now()
-    age = now - mtime
-    age_hours = age.total_seconds() / 3600
+    age_hours = _age_hours(mtime)
     
     # Check if fresh
     fresh = age_hours <= threshold_hours
@@ -51,37 +128,80 @@ def check_context_freshness(context_file: Path, threshold_hours: int = 24) -> di
         'age_hours': age_hours,
         'threshold_hours': threshold_hours,
         'status': status,
-        'last_updated': mtime.isoformat()
+        'last_updated': datetime.fromtimestamp(mtime).isoformat()
     }
 
-def calculate_context_health(context_file: Path) -> dict:
-    """Calculate context health score based on various factors."""
-    if not context_file.exists():
-        return {
-            'score': 0,
-            'factors': ['file_missing'],
-            'status': 'missing'
-        }
+@functools.lru_cache(maxsize=4096)
+def _parse_context(context_path: str, mtime_ns: int) -> dict:
+    """
+    Read a context card once and extract what the health and drift checks need.
+    
+    The mtime is part of the cache key, so an edited file is parsed again.
+    """
+    # All markers are ASCII, so the raw bytes are scanned without decoding
+    with open(context_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= CONTEXT_MMAP_THRESHOLD:
+            content = f.read()
+            return _context_markers(content, _FILE_PATH_RE.search(content),
+                                    content.count(b'\n') + 1)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            file_path_match = _FILE_PATH_RE.search(mm[:CONTEXT_HEADER_WINDOW])
+            if file_path_match is None and len(mm) > CONTEXT_HEADER_WINDOW:
+                file_path_match = _FILE_PATH_RE.search(mm[:])
+            return _context_markers(mm, file_path_match, _count_lines(mm, _MAX_COUNTED_LINES))
+
+def _count_lines(mm: mmap.mmap, limit: int) -> int:
+    """Count lines in a mapped file, stopping once limit is reached."""
+    lines, pos = 1, mm.find(b'\n')
+    while pos != -1 and lines < limit:
+        lines += 1
+        pos = mm.find(b'\n', pos + 1)
+    return lines
+
+def _context_markers(buf, file_path_match, lines: int) -> dict:
+    """Build the parsed-card summary from a bytes or mmap buffer."""
+    return {
+        'missing_sections': tuple(
+            factor for section, factor in _REQUIRED_SECTIONS if buf.find(section) == -1
+        ),
+        'lines': lines,
+        'has_frontmatter': buf.find(b'---') != -1,
+        'has_metadata': buf.find(b'updated_at:') != -1,
+        'file_path': file_path_match.group(1).decode('utf-8') if file_path_match else None,
+        'frontmatter': _frontmatter(buf)
+    }
+
+def _frontmatter(buf) -> bytes:
+    """Get the raw YAML frontmatter of a bytes or mmap buffer, or None."""
+    if buf[:3] != b'---':
+        return None
     
-    content = context_file.read_text(encoding='utf-8')
+    end = buf.find(b'\n---', 3)
+    return buf[3:end] if end != -1 else None
+
+def calculate_context_health(context_file: Path, mtime_ns: int = None) -> dict:
+    """Calculate context health score based on various factors."""
+    if mtime_ns is None:
+        try:
+            mtime_ns = context_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {
+                'score': 0,
+                'factors': ['file_missing'],
+                'status': 'missing'
+            }
+    
+    parsed = _parse_context(str(context_file), mtime_ns)
     factors = []
     score = 100
     
     # Check if file has required sections
-    required_sections = [
-        '## Overview',
-        '## Purpose', 
-        '## Dependencies',
-        '## Key Components'
-    ]
-    
-    for section in required_sections:
-        if section not in content:
-            factors.append(f'missing_section_{section.replace("## ", "").lower()}')
-            score -= 15
+    for factor in parsed['missing_sections']:
+        factors.append(factor)
+        score -= 15
     
     # Check file size (penalty for very large files)
-    lines = len(content.split('\n'))
+    lines = parsed['lines']
     if lines > 200:
         factors.append('file_too_large')
         score -= 10
@@ -90,14 +210,13 @@ def calculate_context_health(context_file: Path) -> dict:
         score -= 5
     
     # Check for recent updates
-    freshness = check_context_freshness(context_file)
-    if not freshness['fresh']:
+    if _age_hours(mtime_ns / 1e9) > FRESHNESS_THRESHOLD_HOURS:
         factors.append('context_stale')
         score -= 20
     
     # Check for metadata completeness
-    if '---' in content:  # Has frontmatter
-        if 'updated_at:' in content:
+    if parsed['has_frontmatter']:  # Has frontmatter
+        if parsed['has_metadata']:
             factors.append('has_metadata')
         else:
             factors.append('missing_metadata')
@@ -125,7 +244,7 @@ def calculate_context_health(context_file: Path) -> dict:
         'status': status
     }
 
-def detect_context_drift(project_dir: Path) -> dict:
+def detect_context_drift(project_dir: Path, scan: tuple = None) -> dict:
     """Detect context drift by comparing context files with source files."""
     drift_report = {
         'total_files': 0,
@@ -135,11 +254,16 @@ def detect_context_drift(project_dir: Path) -> dict:
     }
     
     # Find all context files
-    context_files = list(project_dir.rglob("*.ctx.md"))
+    context_files, _, stats = scan or _scan_project(project_dir)
     drift_report['total_files'] = len(context_files)
     
-    for context_file in context_files:
-        drift_info = check_single_file_drift(context_file, project_dir)
+    drift_infos = _map_context_files(
+        check_single_file_drift,
+        context_files,
+        itertools.repeat(project_dir),
+        [stats[context_file].st_mtime_ns for context_file in context_files]
+    )
+    for drift_info in drift_infos:
         if drift_info['has_drift']:
             drift_report['drift_detected'] += 1
             drift_report['drift_details'].append(drift_info)
@@ -156,7 +280,8 @@ def detect_context_drift(project_dir: Path) -> dict:
     
     return drift_report
 
-def check_single_file_drift(context_file: Path, project_dir: Path) -> dict:
+def check_single_file_drift(context_file: Path, project_dir: Path,
+                            context_mtime_ns: int = None) -> dict:
     """Check drift for a single context file."""
     drift_info = {
         'context_file': str(context_file),
@@ -167,21 +292,23 @@ def check_single_file_drift(context_file: Path, project_dir: Path) -> dict:
     }
     
     # Parse context file to find source file path
-    content = context_file.read_text(encoding='utf-8')
+    if context_mtime_ns is None:
+        context_mtime_ns = context_file.stat().st_mtime_ns
+    source_file_path = _parse_context(str(context_file), context_mtime_ns)['file_path']
     
-    # Extract file_path from frontmatter
-    file_path_match = re.search(r'file_path:\s*["\']([^"\']+)["\']', content)
-    if not file_path_match:
+    if source_file_path is None:
         drift_info['drift_type'] = 'missing_file_path'
         drift_info['has_drift'] = True
         drift_info['severity'] = 'high'
         return drift_info
     
-    source_file_path = file_path_match.group(1)
     source_file = project_dir / source_file_path
     
     # Check if source file exists
-    if not source_file.exists():
+    try:
+        source_mtime_ns = source_file.stat().st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        # Same cases exists() reported as missing; permission errors still raise
         drift_info['drift_type'] = 'source_file_missing'
         drift_info['has_drift'] = True
         drift_info['severity'] = 'high'
@@ -189,11 +316,8 @@ def check_single_file_drift(context_file: Path, project_dir: Path) -> dict:
         return drift_info
     
     # Check if source file is newer than context file
-    source_mtime = datetime.fromtimestamp(source_file.stat().st_mtime)
-    context_mtime = datetime.fromtimestamp(context_file.stat().st_mtime)
-    
-    if source_mtime > context_mtime:
-        age_diff = (source_mtime - context_mtime).total_seconds() / 3600
+    if source_mtime_ns > context_mtime_ns:
+        age_diff = (source_mtime_ns - context_mtime_ns) / 3_600_000_000_000
         
         if age_diff > 168:  # 1 week
             drift_info['severity'] = 'high'
@@ -208,6 +332,80 @@ def check_single_file_drift(context_file: Path, project_dir: Path) -> dict:
     
     return drift_info
 
+def _scan_directory(path: str, found: tuple) -> list:
+    """Scan one directory into found, returning its subdirectories."""
+    context_files, source_files, stats = found
+    subdirs = []
+    
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in IGNORED_DIRS:
+                        subdirs.append(entry.path)
+                elif name.endswith(CONTEXT_SUFFIX):
+                    if entry.is_file():
+                        context_file = Path(entry.path)
+                        context_files.append(context_file)
+                        stats[context_file] = entry.stat()
+                else:
+                    if os.path.splitext(name)[1] in SOURCE_EXTENSIONS and entry.is_file():
+                        source_files.append(Path(entry.path))
+    except OSError:
+        pass
+    
+    return subdirs
+
+def _walk_tree(top: str) -> tuple:
+    """Walk a directory tree, collecting context and source files."""
+    found = ([], [], {})
+    stack = [top]
+    while stack:
+        stack.extend(_scan_directory(stack.pop(), found))
+    return found
+
+def _scan_project(project_dir: Path) -> tuple:
+    """
+    Walk a project once, collecting everything the quality gates need.
+    
+    Top-level subdirectories are walked in parallel. Returns
+    (context_files, source_files, {context_file: stat_result}).
+    """
+    found = ([], [], {})
+    subdirs = _scan_directory(os.fspath(project_dir), found)
+    
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            for context_files, source_files, stats in executor.map(_walk_tree, subdirs):
+                found[0].extend(context_files)
+                found[1].extend(source_files)
+                found[2].update(stats)
+    
+    return found
+
+def _root_prefix_len(project_path: Path) -> int:
+    """Characters to strip from a scanned path to make it project-relative."""
+    root = str(project_path)
+    if root == '.':
+        # Path() drops the leading './' from scanned entries
+        return 0
+    return len(root) if root.endswith(os.sep) else len(root) + 1
+
+def _map_context_files(func, context_files: list, *args) -> list:
+    """Map a per-file check over context files, on threads for larger projects."""
+    if len(context_files) <= PARALLEL_THRESHOLD:
+        return list(map(func, context_files, *args))
+    
+    with ThreadPoolExecutor(max_workers=CHECK_WORKERS) as executor:
+        return list(executor.map(func, context_files, *args))
+
+def _count_fresh(context_files: list, stats: dict,
+                 threshold_hours: int = FRESHNESS_THRESHOLD_HOURS) -> int:
+    """Count context files modified within the threshold, comparing integer mtimes."""
+    cutoff_ns = time.time_ns() - threshold_hours * 3_600_000_000_000
+    return sum(stats[context_file].st_mtime_ns >= cutoff_ns for context_file in context_files)
+
 def run_quality_gates(project_dir: Path) -> dict:
     """Run all quality gates for the project."""
     quality_report = {
@@ -218,20 +416,23 @@ def run_quality_gates(project_dir: Path) -> dict:
         'recommendations': []
     }
     
+    # Walk the project once and share the results across gates
+    scan = _scan_project(project_dir)
+    
     # Quality Gate 1: Context Coverage
-    coverage_gate = check_context_coverage(project_dir)
+    coverage_gate = check_context_coverage(project_dir, scan)
     quality_report['gates']['coverage'] = coverage_gate
     
     # Quality Gate 2: Context Freshness
-    freshness_gate = check_context_freshness_gate(project_dir)
+    freshness_gate = check_context_freshness_gate(project_dir, scan)
     quality_report['gates']['freshness'] = freshness_gate
     
     # Quality Gate 3: Context Health
-    health_gate = check_context_health_gate(project_dir)
+    health_gate = check_context_health_gate(project_dir, scan)
     quality_report['gates']['health'] = health_gate
     
     # Quality Gate 4: Schema Validation
-    schema_gate = check_schema_validation_gate(project_dir)
+    schema_gate = check_schema_validation_gate(project_dir, scan)
     quality_report['gates']['schema'] = schema_gate
     
     # Calculate overall score
@@ -243,36 +444,22 @@ def run_quality_gates(project_dir: Path) -> dict:
     
     return quality_report
 
-def check_context_coverage(project_dir: Path) -> dict:
+def _gate_band(value: float, thresholds: tuple) -> tuple:
+    """Return the (score, status) of the band a gate metric falls in."""
+    band = bisect_right(thresholds, value)
+    return _GATE_SCORES[band], _GATE_STATUSES[band]
+
+def check_context_coverage(project_dir: Path, scan: tuple = None) -> dict:
     """Check context coverage quality gate."""
-    # Find all source files
-    source_extensions = ['.py', '.go', '.js', '.ts', '.java', '.cs', '.cpp', '.c', '.rs']
-    source_files = []
-    
-    for ext in source_extensions:
-        source_files.extend(project_dir.rglob(f"*{ext}"))
-    
-    # Find all context files
-    context_files = list(project_dir.rglob("*.ctx.md"))
+    # Find all source and context files
+    context_files, source_files, _ = scan or _scan_project(project_dir)
     
     # Calculate coverage
     total_source = len(source_files)
     total_context = len(context_files)
     coverage_percentage = (total_context / total_source * 100) if total_source > 0 else 0
     
-    # Determine score and status
-    if coverage_percentage >= 90:
-        score = 100
-        status = 'excellent'
-    elif coverage_percentage >= 75:
-        score = 80
-        status = 'good'
-    elif coverage_percentage >= 50:
-        score = 60
-        status = 'fair'
-    else:
-        score = 30
-        status = 'poor'
+    score, status = _gate_band(coverage_percentage, _COVERAGE_THRESHOLDS)
     
     return {
         'name': 'Context Coverage',
@@ -286,9 +473,9 @@ def check_context_coverage(project_dir: Path) -> dict:
         }
     }
 
-def check_context_freshness_gate(project_dir: Path) -> dict:
+def check_context_freshness_gate(project_dir: Path, scan: tuple = None) -> dict:
     """Check context freshness quality gate."""
-    context_files = list(project_dir.rglob("*.ctx.md"))
+    context_files, _, stats = scan or _scan_project(project_dir)
     
     if not context_files:
         return {
@@ -299,29 +486,12 @@ def check_context_freshness_gate(project_dir: Path) -> dict:
             'details': {'fresh_files': 0, 'total_files': 0}
         }
     
-    fresh_count = 0
+    fresh_count = _count_fresh(context_files, stats)
     total_count = len(context_files)
     
-    for context_file in context_files:
-        freshness = check_context_freshness(context_file)
-        if freshness['fresh']:
-            fresh_count += 1
+    freshness_percentage = fresh_count / total_count * 100
     
-    freshness_percentage = (fresh_count / total_count * 100) if total_count > 0 else 0
-    
-    # Determine score and status
-    if freshness_percentage >= 95:
-        score = 100
-        status = 'excellent'
-    elif freshness_percentage >= 80:
-        score = 80
-        status = 'good'
-    elif freshness_percentage >= 60:
-        score = 60
-        status = 'fair'
-    else:
-        score = 30
-        status = 'poor'
+    score, status = _gate_band(freshness_percentage, _FRESHNESS_THRESHOLDS)
     
     return {
         'name': 'Context Freshness',
@@ -335,9 +505,9 @@ def check_context_freshness_gate(project_dir: Path) -> dict:
         }
     }
 
-def check_context_health_gate(project_dir: Path) -> dict:
+def check_context_health_gate(project_dir: Path, scan: tuple = None) -> dict:
     """Check context health quality gate."""
-    context_files = list(project_dir.rglob("*.ctx.md"))
+    context_files, _, stats = scan or _scan_project(project_dir)
     
     if not context_files:
         return {
@@ -351,25 +521,16 @@ def check_context_health_gate(project_dir: Path) -> dict:
     total_score = 0
     total_count = len(context_files)
     
-    for context_file in context_files:
-        health = calculate_context_health(context_file)
+    for health in _map_context_files(
+        calculate_context_health,
+        context_files,
+        [stats[context_file].st_mtime_ns for context_file in context_files]
+    ):
         total_score += health['score']
     
-    average_health = total_score / total_count if total_count > 0 else 0
+    average_health = total_score / total_count
     
-    # Determine score and status
-    if average_health >= 85:
-        score = 100
-        status = 'excellent'
-    elif average_health >= 70:
-        score = 80
-        status = 'good'
-    elif average_health >= 50:
-        score = 60
-        status = 'fair'
-    else:
-        score = 30
-        status = 'poor'
+    score, status = _gate_band(average_health, _HEALTH_THRESHOLDS)
     
     return {
         'name': 'Context Health',
@@ -382,21 +543,95 @@ def check_context_health_gate(project_dir: Path) -> dict:
         }
     }
 
-def check_schema_validation_gate(project_dir: Path) -> dict:
-    """Check schema validation quality gate."""
-    # This is a placeholder - actual schema validation would be implemented
-    # based on the specific schemas used in the project
+def check_schema_validation_gate(project_dir: Path, scan: tuple = None) -> dict:
+    """Check context card frontmatter against the project's context card schema."""
+    from jsonschema.exceptions import SchemaError
+    
+    schema_path = project_dir / CONTEXT_CARD_SCHEMA
+    try:
+        validator = _schema_validator(str(schema_path), schema_path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return {
+            'name': 'Schema Validation',
+            'score': 100,
+            'status': 'excellent',
+            'metric': '100%',
+            'details': {
+                'note': f'No context card schema at {CONTEXT_CARD_SCHEMA}'
+            }
+        }
+    except (OSError, ValueError, SchemaError) as e:
+        # An unreadable or broken schema fails this gate instead of the whole run
+        return {
+            'name': 'Schema Validation',
+            'score': 0,
+            'status': 'poor',
+            'metric': '0%',
+            'details': {
+                'note': f"Invalid context card schema at {CONTEXT_CARD_SCHEMA}: {str(e).splitlines()[0]}"
+            }
+        }
+    
+    context_files, _, stats = scan or _scan_project(project_dir)
+    total_count = len(context_files)
+    if not total_count:
+        return {
+            'name': 'Schema Validation',
+            'score': 0,
+            'status': 'missing',
+            'metric': '0%',
+            'details': {'valid_files': 0, 'total_files': 0}
+        }
+    
+    valid_count = sum(_map_context_files(
+        _matches_schema,
+        context_files,
+        itertools.repeat(validator),
+        [stats[context_file].st_mtime_ns for context_file in context_files]
+    ))
+    valid_percentage = valid_count / total_count * 100
+    
+    score, status = _gate_band(valid_percentage, _SCHEMA_THRESHOLDS)
     
     return {
         'name': 'Schema Validation',
-        'score': 100,  # Placeholder
-        'status': 'excellent',
-        'metric': '100%',
+        'score': score,
+        'status': status,
+        'metric': f"{valid_percentage:.1f}%",
         'details': {
-            'note': 'Schema validation not yet implemented'
+            'valid_files': valid_count,
+            'total_files': total_count,
+            'valid_percentage': valid_percentage
         }
     }
 
+@functools.lru_cache(maxsize=16)
+def _schema_validator(schema_path: str, mtime_ns: int):
+    """
+    Load and compile a JSON schema once, using the draft it declares.
+    
+    The mtime is part of the cache key, so an edited schema is compiled again.
+    """
+    from jsonschema.validators import validator_for
+    
+    schema = json.loads(read_bytes(schema_path))
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+def _matches_schema(context_file: Path, validator, mtime_ns: int) -> bool:
+    """Check whether a context card's YAML frontmatter satisfies a schema."""
+    frontmatter = _parse_context(str(context_file), mtime_ns)['frontmatter']
+    if frontmatter is None:
+        return False
+    
+    try:
+        data = yaml.load(frontmatter, Loader=_FrontmatterLoader)
+    except yaml.YAMLError:
+        return False
+    
+    return isinstance(data, dict) and next(validator.iter_errors(data), None) is None
+
 def generate_quality_recommendations(quality_report: dict) -> list:
     """Generate recommendations based on quality report."""
     recommendations = []
@@ -412,12 +647,39 @@ def generate_quality_recommendations(quality_report: dict) -> list:
             elif gate_name == 'health':
                 if gate['details']['average_health'] < 70:
                     recommendations.append(f"Improve context health from {gate['details']['average_health']:.1f} to at least 70")
+            elif gate_name == 'schema':
+                if gate['details'].get('valid_percentage', 100) < 80:
+                    recommendations.append(f"Fix context card frontmatter so at least 80% matches the schema (currently {gate['details']['valid_percentage']:.1f}%)")
     
     if not recommendations:
         recommendations.append("All quality gates are passing. Keep up the good work!")
     
     return recommendations
 
+def _print_report_table(title: str, columns: tuple, rows: list) -> None:
+    """
+    Print per-file report rows as a Rich table, or as TSV when output is piped.
+    
+    columns holds (header, style) pairs.
+    """
+    if not console.is_terminal:
+        # CI logs and redirects get plain tab-separated lines without
+        # Rich's per-cell layout work
+        out = console.file
+        out.write('\t'.join(header for header, _ in columns) + '\n')
+        out.writelines('\t'.join(row) + '\n' for row in rows)
+        out.flush()
+        return
+    
+    from rich.table import Table
+    
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
 @click.command()
 @click.option('--file', '-f', type=click.Path(exists=True), help='Single file path')
 @click.option('--project', '-p', type=click.Path(), default='.', help='Project directory')
@@ -444,23 +706,21 @@ def context_freshness(file, project, threshold):
                 console.print(f"  Threshold: {freshness['threshold_hours']} hours")
         else:
             project_path = Path(project)
-            context_files = list(project_path.rglob("*.ctx.md"))
+            context_files, _, stats = _scan_project(project_path)
+            root_len = _root_prefix_len(project_path)
             
             if not context_files:
                 console.print("[yellow]No context files found in project[/yellow]")
                 return
             
-            table = Table(title=f"Context Freshness Report (Threshold: {threshold}h)")
-            table.add_column("File", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Last Updated", style="yellow")
-            table.add_column("Age (hours)", style="blue")
-            
+            rows = []
             fresh_count = 0
             total_count = len(context_files)
             
             for context_file in context_files:
-                freshness = check_context_freshness(context_file, threshold)
+                freshness = check_context_freshness(
+                    context_file, threshold, stats[context_file].st_mtime
+                )
                 
                 status_emoji = {
                     'fresh': '✅',
@@ -471,14 +731,19 @@ def context_freshness(file, project, threshold):
                 if freshness['fresh']:
                     fresh_count += 1
                 
-                table.add_row(
-                    str(context_file.relative_to(project_path)),
+                rows.append((
+                    str(context_file)[root_len:],
                     f"{status_emoji} {freshness['status'].upper()}",
                     freshness['last_updated'] or 'N/A',
                     f"{freshness['age_hours']:.1f}" if freshness['age_hours'] else 'N/A'
-                )
+                ))
             
-            console.print(table)
+            _print_report_table(
+                f"Context Freshness Report (Threshold: {threshold}h)",
+                (("File", "cyan"), ("Status", "green"),
+                 ("Last Updated", "yellow"), ("Age (hours)", "blue")),
+                rows
+            )
             
             # Summary
             freshness_percentage = (fresh_count / total_count * 100) if total_count > 0 else 0
@@ -507,22 +772,18 @@ def context_health(file, project, detailed):
                 console.print(f"  Factors: {', '.join(health['factors'])}")
         else:
             project_path = Path(project)
-            context_files = list(project_path.rglob("*.ctx.md"))
+            context_files, _, stats = _scan_project(project_path)
+            root_len = _root_prefix_len(project_path)
             
             if not context_files:
                 console.print("[yellow]No context files found in project[/yellow]")
                 return
             
-            table = Table(title="Context Health Report")
-            table.add_column("File", style="cyan")
-            table.add_column("Score", style="green")
-            table.add_column("Status", style="yellow")
-            table.add_column("Factors", style="blue")
-            
+            rows = []
             total_score = 0
             
             for context_file in context_files:
-                health = calculate_context_health(context_file)
+                health = calculate_context_health(context_file, stats[context_file].st_mtime_ns)
                 total_score += health['score']
                 
                 status_emoji = {
@@ -536,14 +797,19 @@ def context_health(file, project, detailed):
                 if len(health['factors']) > 3:
                     factors_display += f" (+{len(health['factors']) - 3} more)"
                 
-                table.add_row(
-                    str(context_file.relative_to(project_path)),
+                rows.append((
+                    str(context_file)[root_len:],
                     f"{health['score']}/100",
                     f"{status_emoji} {health['status'].upper()}",
                     factors_display
-                )
+                ))
             
-            console.print(table)
+            _print_report_table(
+                "Context Health Report",
+                (("File", "cyan"), ("Score", "green"),
+                 ("Status", "yellow"), ("Factors", "blue")),
+                rows
+            )
             
             # Summary
             average_health = total_score / len(context_files) if context_files else 0
@@ -561,6 +827,8 @@ def drift_detection(project, output):
     try:
         project_path = Path(project)
         
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -585,12 +853,7 @@ def drift_detection(project, output):
             console.print(f"Severity: {drift_report['severity'].upper()}")
             
             # Show drift details
-            table = Table(title="Context Drift Details")
-            table.add_column("Context File", style="cyan")
-            table.add_column("Drift Type", style="red")
-            table.add_column("Severity", style="yellow")
-            table.add_column("Details", style="blue")
-            
+            rows = []
             for drift in drift_report['drift_details']:
                 severity_emoji = {
                     'low': '🟡',
@@ -598,20 +861,24 @@ def drift_detection(project, output):
                     'high': '🔴'
                 }.get(drift['severity'], '❓')
                 
-                table.add_row(
+                rows.append((
                     Path(drift['context_file']).name,
                     drift['drift_type'].replace('_', ' ').title(),
                     f"{severity_emoji} {drift['severity'].upper()}",
                     '; '.join(drift['details'])
-                )
+                ))
             
-            console.print(table)
+            _print_report_table(
+                "Context Drift Details",
+                (("Context File", "cyan"), ("Drift Type", "red"),
+                 ("Severity", "yellow"), ("Details", "blue")),
+                rows
+            )
         
         # Save report if output specified
         if output:
             output_path = Path(output)
-            with output_path.open('w') as f:
-                json.dump(drift_report, f, indent=2)
+            output_path.write_bytes(json_bytes(drift_report))
             console.print(f"[green]Drift report saved to: {output_path}[/green]")
             
     except Exception as e:
@@ -626,6 +893,9 @@ def quality_gates(project, output):
     try:
         project_path = Path(project)
         
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from rich.table import Table
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -674,8 +944,7 @@ def quality_gates(project, output):
         # Save report if output specified
         if output:
             output_path = Path(output)
-            with output_path.open('w') as f:
-                json.dump(quality_report, f, indent=2)
+            output_path.write_bytes(json_bytes(quality_report))
             console.print(f"[green]Quality report saved to: {output_path}[/green]")
             
     except Exception as e:
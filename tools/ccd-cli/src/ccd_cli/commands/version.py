@@ -5,9 +5,6 @@ Show CCD CLI version information.
 """
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
 
 from .. import __version__, __author__, __email__
 
@@ -16,6 +13,8 @@ console = Console()
 
 def version_command():
     """Show CCD CLI version information."""
+    from rich.panel import Panel
+    from rich.table import Table
     
     # Create version table
     table = Table(show_header=False, box=None)
@@ -68,15 +68,21 @@ class CODEMAP:
         }
         self.modules: List[Dict[str, Any]] = []
         self.dependencies: List[Dict[str, Any]] = []
-        self.metadata = {
-            'created': datetime.now().isoformat(),
-            'updated': datetime.now().isoformat(),
-            'generator': {
-                'tool': 'ccd-cli',
-                'version': '1.0.0',
-                'timestamp': datetime.now().isoformat()
+        
+        # Loaded documents bring their own metadata; only stamp new ones
+        metadata = kwargs.get('metadata')
+        if metadata is None:
+            timestamp = datetime.now().isoformat()
+            metadata = {
+                'created': timestamp,
+                'updated': timestamp,
+                'generator': {
+                    'tool': 'ccd-cli',
+                    'version': '1.0.0',
+                    'timestamp': timestamp
+                }
             }
-        }
+        self.metadata = metadata
     
     def add_module(self, module: ModuleInfo) -> None:
         """
@@ -129,8 +135,9 @@ class CODEMAP:
     
     def _update_metadata(self) -> None:
         """Update metadata timestamps."""
-        self.metadata['updated'] = datetime.now().isoformat()
-        self.metadata['generator']['timestamp'] = datetime.now().isoformat()
+        timestamp = datetime.now().isoformat()
+        self.metadata['updated'] = timestamp
+        self.metadata['generator']['timestamp'] = timestamp
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -161,14 +168,14 @@ class CODEMAP:
         codemap = cls(
             project_name=data['project']['name'],
             description=data['project']['description'],
-            domain=data['project']['domain']
+            domain=data['project']['domain'],
+            metadata=data.get('metadata', {})
         )
         
         codemap.version = data.get('version', '1.0.0')
         codemap.project.update(data['project'])
         codemap.modules = data.get('modules', [])
         codemap.dependencies = data.get('dependencies', [])
-        codemap.metadata = data.get('metadata', {})
         
         return codemap
     
@@ -8,7 +8,117 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+import functools
 import re
+import sys
+
+
+# Language by lowercase file extension
+_LANGUAGE_MAP = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.go': 'go',
+    '.java': 'java',
+    '.cpp': 'cpp',
+    '.c': 'c',
+    '.rs': 'rust',
+    '.php': 'php',
+    '.rb': 'ruby',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.scala': 'scala',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.json': 'json',
+    '.xml': 'xml',
+    '.html': 'html',
+    '.css': 'css',
+    '.sql': 'sql',
+    '.sh': 'bash',
+    '.ps1': 'powershell',
+    '.md': 'markdown',
+    '.adoc': 'asciidoc'
+}
+
+# Common three-character extensions resolved without splitting the path
+_COMMON_EXTENSIONS = ('.py', '.js', '.ts', '.go', '.md')
+
+# Path keywords for each domain, checked in priority order; the first domain
+# with any keyword in the path wins
+_DOMAIN_KEYWORDS = (
+    ('api', ('api/', 'endpoint', 'controller', 'route')),
+    ('business-logic', ('service', 'business', 'logic', 'core')),
+    ('data-access', ('model', 'entity', 'dao', 'repository')),
+    ('configuration', ('config', 'settings', 'env')),
+    ('deployment', ('deploy', 'docker', 'k8s', 'helm')),
+    ('testing', ('test', 'spec', 'specs')),
+    ('ui', ('ui/', 'component', 'view', 'page')),
+    ('utility', ('util', 'helper', 'common')),
+)
+
+# "language: x" / "domain: x" entries read back by from_markdown
+_METADATA_FIELD_RE = re.compile(r'(language|domain):\s*(\w+)')
+
+# Bullet prefixes for the metadata fields every card carries; keys added by
+# callers get their label built at render time
+_METADATA_LABELS = {
+    key: f"- **{key.replace('_', ' ').title()}**: "
+    for key in (
+        'file_path', 'language', 'domain', 'size', 'lines', 'last_modified',
+        'author', 'version', 'complexity', 'priority', 'tags'
+    )
+}
+
+# Metadata fields that hold lists, rendered comma-separated
+_LIST_METADATA_KEYS = frozenset(('tags',))
+
+# Fields rendered as "- **Label**: value" bullets in the Testing,
+# Performance, Security and Maintenance sections, as (key, label, is_list);
+# list fields become a label bullet with one nested bullet per item
+_TESTING_LIST_FIELDS = (
+    ('test_scenarios', 'Test Scenarios', True),
+    ('mocking', 'Mocking Required', True),
+)
+_PERFORMANCE_FIELDS = (
+    ('time_complexity', 'Time Complexity', False),
+    ('space_complexity', 'Space Complexity', False),
+    ('bottlenecks', 'Known Bottlenecks', True),
+    ('optimizations', 'Optimizations Applied', True),
+)
+_SECURITY_FIELDS = (
+    ('vulnerabilities', 'Known Vulnerabilities', True),
+    ('mitigations', 'Security Mitigations', True),
+    ('authentication', 'Authentication', False),
+    ('authorization', 'Authorization', False),
+    ('data_validation', 'Data Validation', False),
+)
+_MAINTENANCE_FIELDS = (
+    ('owner', 'Owner', False),
+    ('review_schedule', 'Review Schedule', False),
+    ('deprecation_plan', 'Deprecation Plan', False),
+    ('migration_path', 'Migration Path', False),
+)
+
+# Usage lists rendered as their own subsections, as (key, heading)
+_USAGE_LIST_SECTIONS = (
+    ('common_patterns', 'Common Patterns'),
+    ('best_practices', 'Best Practices'),
+    ('anti_patterns', 'Anti-patterns'),
+)
+
+
+def _append_fields(md_lines: List[str], values: Dict[str, Any], fields: tuple) -> None:
+    """Append a bullet for each non-empty field, nesting list items."""
+    for key, label, is_list in fields:
+        value = values.get(key)
+        if not value:
+            continue
+        if is_list:
+            md_lines.append(f"- **{label}**:")
+            md_lines.extend(f"  - {item}" for item in value)
+        else:
+            md_lines.append(f"- **{label}**: {value}")
 
 
 @dataclass
@@ -47,6 +157,16 @@ class ComponentInfo:
     returns: Optional[str] = None
 
 
+@dataclass
+class ChangelogEntry:
+    """Changelog entry for context card."""
+    date: str
+    change: str
+    author: str
+    version: Optional[str] = None
+    reason: Optional[str] = None
+
+
 class ContextCard:
     """
     File-level context documentation.
@@ -55,6 +175,14 @@ class ContextCard:
     including its purpose, dependencies, components, and usage information.
     """
     
+    # Cards are built in bulk during repository scans; slots drop the
+    # per-instance __dict__
+    __slots__ = (
+        'metadata', 'overview', 'purpose', 'dependencies', 'key_components',
+        'usage', 'testing', 'performance', 'security', 'maintenance',
+        'related', 'changelog', 'notes'
+    )
+    
     def __init__(self, file_path: str, **kwargs):
         """
         Initialize a new context card.
@@ -99,62 +227,46 @@ class ContextCard:
         self.security = kwargs.get('security', {})
         self.maintenance = kwargs.get('maintenance', {})
         self.related = kwargs.get('related', {})
-        self.changelog = kwargs.get('changelog', [])
+        self.changelog = [self._changelog_entry(entry) for entry in kwargs.get('changelog', [])]
         self.notes = kwargs.get('notes', '')
     
+    @staticmethod
+    def _changelog_entry(entry: Any) -> ChangelogEntry:
+        """Convert a changelog entry given as a dict into a ChangelogEntry."""
+        if not isinstance(entry, dict):
+            return entry
+        return ChangelogEntry(
+            date=entry['date'],
+            change=entry['change'],
+            author=entry['author'],
+            version=entry.get('version'),
+            reason=entry.get('reason')
+        )
+    
     def _detect_language(self, file_path: str) -> str:
         """Detect programming language from file extension."""
-        ext = Path(file_path).suffix.lower()
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.go': 'go',
-            '.java': 'java',
-            '.cpp': 'cpp',
-            '.c': 'c',
-            '.rs': 'rust',
-            '.php': 'php',
-            '.rb': 'ruby',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.scala': 'scala',
-            '.yaml': 'yaml',
-            '.yml': 'yaml',
-            '.json': 'json',
-            '.xml': 'xml',
-            '.html': 'html',
-            '.css': 'css',
-            '.sql': 'sql',
-            '.sh': 'bash',
-            '.ps1': 'powershell',
-            '.md': 'markdown',
-            '.adoc': 'asciidoc'
-        }
-        return language_map.get(ext, 'other')
+        # A character other than '/' before the dot keeps dotfiles like
+        # "src/.md" out of the fast path
+        if file_path.endswith(_COMMON_EXTENSIONS) and file_path[-4:-3] not in ('/', ''):
+            return _LANGUAGE_MAP[file_path[-3:]]
+        
+        name = file_path.rpartition('/')[2]
+        dot = name.rfind('.')
+        # Like Path.suffix, a leading dot (".env") does not start an extension
+        ext = name[dot:].lower() if dot > 0 else ''
+        return _LANGUAGE_MAP.get(ext, 'other')
     
-    def _detect_domain(self, file_path: str) -> str:
-        """Detect domain from file path."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _detect_domain(file_path: str) -> str:
+        """Detect domain from file path, caching results for repeated paths."""
         path_lower = file_path.lower()
         
-        if any(x in path_lower for x in ['api/', 'endpoint', 'controller', 'route']):
-            return 'api'
-        elif any(x in path_lower for x in ['service', 'business', 'logic', 'core']):
-            return 'business-logic'
-        elif any(x in path_lower for x in ['model', 'entity', 'dao', 'repository']):
-            return 'data-access'
-        elif any(x in path_lower for x in ['config', 'settings', 'env']):
-            return 'configuration'
-        elif any(x in path_lower for x in ['deploy', 'docker', 'k8s', 'helm']):
-            return 'deployment'
-        elif any(x in path_lower for x in ['test', 'spec', 'specs']):
-            return 'testing'
-        elif any(x in path_lower for x in ['ui/', 'component', 'view', 'page']):
-            return 'ui'
-        elif any(x in path_lower for x in ['util', 'helper', 'common']):
-            return 'utility'
-        else:
-            return 'other'
+        for domain, keywords in _DOMAIN_KEYWORDS:
+            for keyword in keywords:
+                if keyword in path_lower:
+                    return domain
+        return 'other'
     
     def add_import(self, name: str, purpose: str, version: Optional[str] = None) -> None:
         """
@@ -252,17 +364,13 @@ class ContextCard:
             author: Author of the change
             **kwargs: Additional changelog properties
         """
-        entry = {
-            'date': date,
-            'change': change,
-            'author': author,
-            'version': kwargs.get('version'),
-            'reason': kwargs.get('reason')
-        }
-        
-        # Remove None values
-        entry = {k: v for k, v in entry.items() if v is not None}
-        
+        entry = ChangelogEntry(
+            date=date,
+            change=change,
+            author=author,
+            version=kwargs.get('version'),
+            reason=kwargs.get('reason')
+        )
         self.changelog.append(entry)
     
     def to_markdown(self) -> str:
@@ -281,11 +389,19 @@ class ContextCard:
         # Metadata
         md_lines.append("## Metadata")
         for key, value in self.metadata.items():
-            if value is not None:
-                if isinstance(value, list):
-                    md_lines.append(f"- **{key.replace('_', ' ').title()}**: {', '.join(value)}")
-                else:
-                    md_lines.append(f"- **{key.replace('_', ' ').title()}**: {value}")
+            if value is None:
+                continue
+            label = _METADATA_LABELS.get(key)
+            if label is None:
+                label = f"- **{key.replace('_', ' ').title()}**: "
+            elif key not in _LIST_METADATA_KEYS:
+                # Known scalar fields skip the list check
+                md_lines.append(f"{label}{value}")
+                continue
+            if isinstance(value, list):
+                md_lines.append(label + ', '.join(value))
+            else:
+                md_lines.append(f"{label}{value}")
         md_lines.append("")
         
         # Overview
@@ -385,23 +501,11 @@ class ContextCard:
                         md_lines.append(f"**Output**: {example['output']}")
                     md_lines.append("")
             
-            if self.usage.get('common_patterns'):
-                md_lines.append("### Common Patterns")
-                for pattern in self.usage['common_patterns']:
-                    md_lines.append(f"- {pattern}")
-                md_lines.append("")
-            
-            if self.usage.get('best_practices'):
-                md_lines.append("### Best Practices")
-                for practice in self.usage['best_practices']:
-                    md_lines.append(f"- {practice}")
-                md_lines.append("")
-            
-            if self.usage.get('anti_patterns'):
-                md_lines.append("### Anti-patterns")
-                for anti_pattern in self.usage['anti_patterns']:
-                    md_lines.append(f"- {anti_pattern}")
-                md_lines.append("")
+            for key, heading in _USAGE_LIST_SECTIONS:
+                if self.usage.get(key):
+                    md_lines.append(f"### {heading}")
+                    md_lines.extend(f"- {item}" for item in self.usage[key])
+                    md_lines.append("")
         
         # Testing
         if self.testing:
@@ -413,15 +517,7 @@ class ContextCard:
             if self.testing.get('test_coverage') is not None:
                 md_lines.append(f"- **Test Coverage**: {self.testing['test_coverage']}%")
             
-            if self.testing.get('test_scenarios'):
-                md_lines.append("- **Test Scenarios**:")
-                for scenario in self.testing['test_scenarios']:
-                    md_lines.append(f"  - {scenario}")
-            
-            if self.testing.get('mocking'):
-                md_lines.append("- **Mocking Required**:")
-                for mock in self.testing['mocking']:
-                    md_lines.append(f"  - {mock}")
+            _append_fields(md_lines, self.testing, _TESTING_LIST_FIELDS)
             
             md_lines.append("")
         
@@ -429,21 +525,7 @@ class ContextCard:
         if self.performance:
             md_lines.append("## Performance")
             
-            if self.performance.get('time_complexity'):
-                md_lines.append(f"- **Time Complexity**: {self.performance['time_complexity']}")
-            
-            if self.performance.get('space_complexity'):
-                md_lines.append(f"- **Space Complexity**: {self.performance['space_complexity']}")
-            
-            if self.performance.get('bottlenecks'):
-                md_lines.append("- **Known Bottlenecks**:")
-                for bottleneck in self.performance['bottlenecks']:
-                    md_lines.append(f"  - {bottleneck}")
-            
-            if self.performance.get('optimizations'):
-                md_lines.append("- **Optimizations Applied**:")
-                for opt in self.performance['optimizations']:
-                    md_lines.append(f"  - {opt}")
+            _append_fields(md_lines, self.performance, _PERFORMANCE_FIELDS)
             
             md_lines.append("")
         
@@ -451,24 +533,7 @@ class ContextCard:
         if self.security:
             md_lines.append("## Security")
             
-            if self.security.get('vulnerabilities'):
-                md_lines.append("- **Known Vulnerabilities**:")
-                for vuln in self.security['vulnerabilities']:
-                    md_lines.append(f"  - {vuln}")
-            
-            if self.security.get('mitigations'):
-                md_lines.append("- **Security Mitigations**:")
-                for mitigation in self.security['mitigations']:
-                    md_lines.append(f"  - {mitigation}")
-            
-            if self.security.get('authentication'):
-                md_lines.append(f"- **Authentication**: {self.security['authentication']}")
-            
-            if self.security.get('authorization'):
-                md_lines.append(f"- **Authorization**: {self.security['authorization']}")
-            
-            if self.security.get('data_validation'):
-                md_lines.append(f"- **Data Validation**: {self.security['data_validation']}")
+            _append_fields(md_lines, self.security, _SECURITY_FIELDS)
             
             md_lines.append("")
         
@@ -476,17 +541,7 @@ class ContextCard:
         if self.maintenance:
             md_lines.append("## Maintenance")
             
-            if self.maintenance.get('owner'):
-                md_lines.append(f"- **Owner**: {self.maintenance['owner']}")
-            
-            if self.maintenance.get('review_schedule'):
-                md_lines.append(f"- **Review Schedule**: {self.maintenance['review_schedule']}")
-            
-            if self.maintenance.get('deprecation_plan'):
-                md_lines.append(f"- **Deprecation Plan**: {self.maintenance['deprecation_plan']}")
-            
-            if self.maintenance.get('migration_path'):
-                md_lines.append(f"- **Migration Path**: {self.maintenance['migration_path']}")
+            _append_fields(md_lines, self.maintenance, _MAINTENANCE_FIELDS)
             
             md_lines.append("")
         
@@ -505,11 +560,11 @@ class ContextCard:
         if self.changelog:
             md_lines.append("## Changelog")
             for entry in self.changelog:
-                md_lines.append(f"- **{entry['date']}** - {entry['change']} (by {entry['author']})")
-                if entry.get('version'):
-                    md_lines.append(f"  - Version: {entry['version']}")
-                if entry.get('reason'):
-                    md_lines.append(f"  - Reason: {entry['reason']}")
+                md_lines.append(f"- **{entry.date}** - {entry.change} (by {entry.author})")
+                if entry.version:
+                    md_lines.append(f"  - Version: {entry.version}")
+                if entry.reason:
+                    md_lines.append(f"  - Reason: {entry.reason}")
             md_lines.append("")
         
         # Notes
@@ -533,26 +588,23 @@ class ContextCard:
             ContextCard instance
         """
         # This is a simplified parser - in practice, you'd want a more robust one
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = file_path.read_text(encoding='utf-8')
         
         # Extract basic information
         metadata = {
-            'file_path': original_path,
             'language': 'other',
             'domain': 'other'
         }
         
-        # Try to extract language and domain from content
-        if 'language: ' in content:
-            lang_match = re.search(r'language:\s*(\w+)', content)
-            if lang_match:
-                metadata['language'] = lang_match.group(1)
-        
-        if 'domain: ' in content:
-            domain_match = re.search(r'domain:\s*(\w+)', content)
-            if domain_match:
-                metadata['domain'] = domain_match.group(1)
+        # Take the first language and domain values in one pass over the content
+        found = {}
+        for match in _METADATA_FIELD_RE.finditer(content):
+            # Interned so loaded cards share one string per language/domain,
+            # like the constants returned by the detectors
+            found.setdefault(match.group(1), sys.intern(match.group(2)))
+            if len(found) == 2:
+                break
+        metadata.update(found)
         
         return cls(original_path, **metadata)
     
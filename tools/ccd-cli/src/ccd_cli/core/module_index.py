@@ -4,13 +4,19 @@ Module Index Class
 Represents module-level context documentation in CCD.
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Any
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+import itertools
+import sys
 import yaml
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FileInfo:
     """File information for module index."""
     path: str
@@ -25,7 +31,7 @@ class FileInfo:
     tags: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class InterfaceInfo:
     """Interface information for module index."""
     name: str
@@ -36,6 +42,28 @@ class InterfaceInfo:
     returns: Optional[str] = None
 
 
+# Keys each stored entry must have a non-empty value for
+_REQUIRED_FILE_KEYS = ('path', 'type', 'description', 'language')
+_REQUIRED_DEPENDENCY_KEYS = ('module', 'type', 'description')
+_REQUIRED_INTERFACE_KEYS = ('name', 'type', 'description')
+
+# Field names of the dataclasses stored as dicts, in output order
+_FILE_FIELDS = tuple(f.name for f in fields(FileInfo))
+_INTERFACE_FIELDS = tuple(f.name for f in fields(InterfaceInfo))
+
+# Categorical values repeated across entries; interned so they are stored once
+_INTERNED_FIELDS = frozenset(('type', 'language', 'complexity', 'priority'))
+
+
+def _non_none_fields(info: Any, names: tuple) -> Dict[str, Any]:
+    """Collect dataclass fields into a dict, leaving out None values."""
+    entry = {name: value for name in names if (value := getattr(info, name)) is not None}
+    for name in _INTERNED_FIELDS.intersection(entry):
+        if isinstance(entry[name], str):
+            entry[name] = sys.intern(entry[name])
+    return entry
+
+
 class ModuleIndex:
     """
     Module-level context documentation.
@@ -44,6 +72,13 @@ class ModuleIndex:
     including its purpose, files, interfaces, and dependencies.
     """
     
+    # Indexes are built in bulk for large repositories; slots drop the
+    # per-instance __dict__
+    __slots__ = (
+        'module', 'purpose', 'responsibilities', 'files', 'dependencies',
+        'interfaces', 'configuration', 'testing', 'deployment', 'metadata'
+    )
+    
     def __init__(self, module_path: str, module_type: str, description: str, **kwargs):
         """
         Initialize a new module index.
@@ -71,15 +106,20 @@ class ModuleIndex:
         self.testing = kwargs.get('testing', {})
         self.deployment = kwargs.get('deployment', {})
         
-        self.metadata = {
-            'created': datetime.now().isoformat(),
-            'updated': datetime.now().isoformat(),
-            'generator': {
-                'tool': 'ccd-cli',
-                'version': '1.0.0',
-                'timestamp': datetime.now().isoformat()
+        # Loaded documents bring their own metadata; only stamp new ones
+        metadata = kwargs.get('metadata')
+        if metadata is None:
+            timestamp = datetime.now().isoformat()
+            metadata = {
+                'created': timestamp,
+                'updated': timestamp,
+                'generator': {
+                    'tool': 'ccd-cli',
+                    'version': '1.0.0',
+                    'timestamp': timestamp
+                }
             }
-        }
+        self.metadata = metadata
     
     def add_file(self, file_info: FileInfo) -> None:
         """
@@ -88,22 +128,7 @@ class ModuleIndex:
         Args:
             file_info: File information
         """
-        file_dict = {
-            'path': file_info.path,
-            'type': file_info.type,
-            'description': file_info.description,
-            'language': file_info.language,
-            'size': file_info.size,
-            'lines': file_info.lines,
-            'context_card': file_info.context_card,
-            'complexity': file_info.complexity,
-            'priority': file_info.priority,
-            'tags': file_info.tags
-        }
-        
-        # Remove None values
-        file_dict = {k: v for k, v in file_dict.items() if v is not None}
-        
+        file_dict = _non_none_fields(file_info, _FILE_FIELDS)
         self.files.append(file_dict)
         self._update_metadata()
     
@@ -118,16 +143,14 @@ class ModuleIndex:
             **kwargs: Additional dependency properties
         """
         dependency = {
-            'module': module,
-            'type': dep_type,
-            'description': description,
-            'version': kwargs.get('version'),
-            'optional': kwargs.get('optional', False)
+            key: value for key, value in (
+                ('module', module),
+                ('type', sys.intern(dep_type) if isinstance(dep_type, str) else dep_type),
+                ('description', description),
+                ('version', kwargs.get('version')),
+                ('optional', kwargs.get('optional', False))
+            ) if value is not None
         }
-        
-        # Remove None values
-        dependency = {k: v for k, v in dependency.items() if v is not None}
-        
         self.dependencies.append(dependency)
         self._update_metadata()
     
@@ -138,25 +161,15 @@ class ModuleIndex:
         Args:
             interface_info: Interface information
         """
-        interface_dict = {
-            'name': interface_info.name,
-            'type': interface_info.type,
-            'description': interface_info.description,
-            'signature': interface_info.signature,
-            'parameters': interface_info.parameters,
-            'returns': interface_info.returns
-        }
-        
-        # Remove None values
-        interface_dict = {k: v for k, v in interface_dict.items() if v is not None}
-        
+        interface_dict = _non_none_fields(interface_info, _INTERFACE_FIELDS)
         self.interfaces.append(interface_dict)
         self._update_metadata()
     
     def _update_metadata(self) -> None:
         """Update metadata timestamps."""
-        self.metadata['updated'] = datetime.now().isoformat()
-        self.metadata['generator']['timestamp'] = datetime.now().isoformat()
+        timestamp = datetime.now().isoformat()
+        self.metadata['updated'] = timestamp
+        self.metadata['generator']['timestamp'] = timestamp
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -192,7 +205,8 @@ class ModuleIndex:
         module_index = cls(
             module_path=data['module']['path'],
             module_type=data['module']['type'],
-            description=data['purpose']
+            description=data['purpose'],
+            metadata=data.get('metadata', {})
         )
         
         module_index.module.update(data['module'])
@@ -203,65 +217,50 @@ class ModuleIndex:
         module_index.configuration = data.get('configuration', {})
         module_index.testing = data.get('testing', {})
         module_index.deployment = data.get('deployment', {})
-        module_index.metadata = data.get('metadata', {})
         
         return module_index
     
-    def validate(self) -> List[str]:
+    def validate(self, fail_fast: bool = False) -> List[str]:
         """
         Validate module index structure.
         
+        Args:
+            fail_fast: Stop at the first error instead of collecting all of them
+            
         Returns:
             List of validation errors
         """
-        errors = []
-        
+        errors = self._iter_errors()
+        return list(itertools.islice(errors, 1) if fail_fast else errors)
+    
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield validation errors lazily, in report order."""
         # Check required fields
         if not self.module.get('name'):
-            errors.append("Module name is required")
+            yield "Module name is required"
         
         if not self.module.get('path'):
-            errors.append("Module path is required")
+            yield "Module path is required"
         
         if not self.module.get('type'):
-            errors.append("Module type is required")
+            yield "Module type is required"
         
         if not self.purpose:
-            errors.append("Module purpose is required")
+            yield "Module purpose is required"
         
         if not self.files:
-            errors.append("At least one file is required")
-        
-        # Check file structure
-        for i, file_info in enumerate(self.files):
-            if not file_info.get('path'):
-                errors.append(f"File {i}: path is required")
-            if not file_info.get('type'):
-                errors.append(f"File {i}: type is required")
-            if not file_info.get('description'):
-                errors.append(f"File {i}: description is required")
-            if not file_info.get('language'):
-                errors.append(f"File {i}: language is required")
-        
-        # Check dependency structure
-        for i, dependency in enumerate(self.dependencies):
-            if not dependency.get('module'):
-                errors.append(f"Dependency {i}: module is required")
-            if not dependency.get('type'):
-                errors.append(f"Dependency {i}: type is required")
-            if not dependency.get('description'):
-                errors.append(f"Dependency {i}: description is required")
-        
-        # Check interface structure
-        for i, interface in enumerate(self.interfaces):
-            if not interface.get('name'):
-                errors.append(f"Interface {i}: name is required")
-            if not interface.get('type'):
-                errors.append(f"Interface {i}: type is required")
-            if not interface.get('description'):
-                errors.append(f"Interface {i}: description is required")
-        
-        return errors
+            yield "At least one file is required"
+        
+        # Check entry structure
+        for label, items, required in (
+            ('File', self.files, _REQUIRED_FILE_KEYS),
+            ('Dependency', self.dependencies, _REQUIRED_DEPENDENCY_KEYS),
+            ('Interface', self.interfaces, _REQUIRED_INTERFACE_KEYS),
+        ):
+            for i, item in enumerate(items):
+                for key in required:
+                    if not item.get(key):
+                        yield f"{label} {i}: {key} is required"
     
     def get_file_by_path(self, path: str) -> Optional[Dict[str, Any]]:
         """
@@ -333,15 +332,16 @@ class ModuleIndex:
         Returns:
             Dictionary with statistics
         """
-        total_lines = sum(file_info.get('lines', 0) for file_info in self.files)
-        
+        # One pass over the files for line totals and both breakdowns
+        total_lines = 0
         languages = {}
+        file_types = {}
         for file_info in self.files:
+            total_lines += file_info.get('lines', 0)
+            
             lang = file_info.get('language', 'unknown')
             languages[lang] = languages.get(lang, 0) + 1
-        
-        file_types = {}
-        for file_info in self.files:
+            
             ftype = file_info.get('type', 'unknown')
             file_types[ftype] = file_types.get(ftype, 0) + 1
         
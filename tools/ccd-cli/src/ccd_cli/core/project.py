@@ -297,16 +297,20 @@ This project implements CCD (Continuous Context Documentation) methodology to ma
             with open(index_path, "w") as f:
                 yaml.dump(module_index.to_dict(), f, default_flow_style=False, sort_keys=False)
         
-        # Save context cards
+        # Save context cards, creating each output directory only once
+        cards_root = self.project_path / "docs" / "context-cards"
+        created_dirs = set()
         for file_path, context_card in self.context_cards.items():
             # Determine output path
             if file_path.startswith("src/"):
-                output_path = self.project_path / "docs" / "context-cards" / file_path.replace("src/", "")
+                output_path = cards_root / file_path.replace("src/", "")
             else:
-                output_path = self.project_path / "docs" / "context-cards" / file_path
+                output_path = cards_root / file_path
             
             # Ensure directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if output_path.parent not in created_dirs:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(output_path.parent)
             
             # Save as .ctx.md
             ctx_path = output_path.with_suffix('.ctx.md')
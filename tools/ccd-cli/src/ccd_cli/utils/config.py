@@ -4,12 +4,59 @@ Configuration Utilities
 Configuration loading and management for CCD CLI.
 """
 
+import copy
+import functools
+import hashlib
+import itertools
+import json
 import os
+import re
+import stat
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 import yaml
 
 from .errors import ConfigurationError
+from .fileio import read_bytes, write_atomic
+
+# libyaml-backed loader and dumper when available
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Config file names looked up by _load_default_config, in priority order
+_CONFIG_FILE_NAMES = ('ccd.config.yaml', 'ccd.config.yml', '.ccd.yaml', '.ccd.yml')
+
+# Subdirectory of the user cache directory holding parsed-JSON copies of
+# YAML config files, so nothing is written into the project itself
+_CACHE_SUBDIR = os.path.join('ccd-cli', 'config')
+
+# Size strings: number followed by optional decimal and unit
+_SIZE_RE = re.compile(r'^\d+(\.\d+)?\s*(B|KB|MB|GB|TB)$')
+
+
+def _env_flag(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() == 'true'
+
+
+# Environment overrides as (variable, section, key, parser); unset or empty
+# variables are skipped and values the parser rejects are ignored
+_ENV_SETTINGS = (
+    ('CCD_PROJECT_NAME', 'project', 'name', str),
+    ('CCD_PROJECT_DOMAIN', 'project', 'domain', str),
+    ('CCD_SCHEMAS_PATH', 'project', 'schemas_path', str),
+    ('CCD_CONTEXTS_PATH', 'project', 'contexts_path', str),
+    ('CCD_AUTO_UPDATE', 'generation', 'auto_update', _env_flag),
+    ('CCD_INCLUDE_TESTS', 'generation', 'include_tests', _env_flag),
+    ('CCD_STRICT_MODE', 'validation', 'strict_mode', _env_flag),
+    ('CCD_FAIL_FAST', 'validation', 'fail_fast', _env_flag),
+    ('CCD_OUTPUT_FORMAT', 'output', 'default_format', str),
+    ('CCD_COLORS', 'output', 'colors', _env_flag),
+    ('CCD_VERBOSE', 'output', 'verbose', _env_flag),
+    ('CCD_QUIET', 'output', 'quiet', _env_flag),
+    ('CCD_WATCH_INTERVAL', 'monitoring', 'watch_interval', int),
+    ('CCD_COVERAGE_THRESHOLD', 'monitoring', 'coverage_threshold', int),
+)
 
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
@@ -105,14 +152,17 @@ def _load_config_file(config_path: str) -> Dict[str, Any]:
     """
     try:
         path = Path(config_path)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             raise ConfigurationError(f"Configuration file not found: {config_path}")
         
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ConfigurationError(f"Path is not a file: {config_path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        # Copied so callers can modify their config without touching the cache
+        stamp = (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+        config = copy.deepcopy(_parse_config_file(os.path.abspath(path), stamp))
         
         if not isinstance(config, dict):
             raise ConfigurationError(f"Configuration file must contain a dictionary: {config_path}")
@@ -125,6 +175,56 @@ def _load_config_file(config_path: str) -> Dict[str, Any]:
         raise ConfigurationError(f"Failed to load configuration file: {config_path}", str(e))
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(config_path: str, stamp: tuple) -> Any:
+    """
+    Parse a configuration file, reusing the result while it is unchanged.
+    
+    stamp holds the file's mtime, ctime, size and inode, so an edited or
+    replaced file is parsed again.
+    """
+    # A sidecar written for this exact file version skips YAML parsing entirely
+    sidecar_path = _sidecar_path(config_path)
+    try:
+        cached = json.loads(read_bytes(sidecar_path))
+        if cached.get('path') == config_path and cached.get('stamp') == list(stamp):
+            return cached['config']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    # libyaml decodes UTF-8 itself, so the raw bytes go straight to the parser
+    config = yaml.load(read_bytes(config_path), Loader=Loader)
+    _write_config_sidecar(sidecar_path, config_path, config, stamp)
+    return config
+
+
+def _sidecar_path(config_path: str) -> Path:
+    """Get the user cache file for an absolute config path."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.sha256(os.fsencode(config_path)).hexdigest()
+    return Path(cache_home, _CACHE_SUBDIR, f'{digest}.json')
+
+
+def _write_config_sidecar(sidecar_path: Path, config_path: str, config: Any, stamp: tuple) -> None:
+    """
+    Cache a parsed configuration as JSON, keyed by the source file's path and stamp.
+    
+    Configs that do not survive a JSON round trip unchanged (dates, non-string
+    keys) are not cached, and write failures are ignored.
+    """
+    if not isinstance(config, dict):
+        return
+    
+    try:
+        data = json.dumps({'path': config_path, 'stamp': list(stamp), 'config': config})
+        if json.loads(data)['config'] != config:
+            return
+        os.makedirs(sidecar_path.parent, mode=0o700, exist_ok=True)
+        write_atomic(sidecar_path, data.encode('utf-8'))
+    except (OSError, TypeError, ValueError):
+        pass
+
+
 def _load_default_config() -> Optional[Dict[str, Any]]:
     """
     Load configuration from default locations.
@@ -132,33 +232,22 @@ def _load_default_config() -> Optional[Dict[str, Any]]:
     Returns:
         Configuration dictionary or None if not found
     """
-    # Look for config files in current directory and parent directories
+    # Look for config files in the current directory and up to 3 parents
     current_dir = Path.cwd()
+    search_dirs = [current_dir, *itertools.islice(current_dir.parents, 3)]
     
-    config_files = [
-        'ccd.config.yaml',
-        'ccd.config.yml',
-        '.ccd.yaml',
-        '.ccd.yml'
-    ]
-    
-    # Check current directory
-    for config_file in config_files:
-        config_path = current_dir / config_file
-        if config_path.exists():
-            try:
-                return _load_config_file(str(config_path))
-            except ConfigurationError:
-                continue
-    
-    # Check parent directories (up to 3 levels)
-    for i in range(3):
-        current_dir = current_dir.parent
-        for config_file in config_files:
-            config_path = current_dir / config_file
-            if config_path.exists():
+    for search_dir in search_dirs:
+        # One directory listing instead of a stat per candidate name
+        try:
+            with os.scandir(search_dir) as it:
+                present = {entry.name for entry in it if entry.name in _CONFIG_FILE_NAMES}
+        except OSError:
+            continue
+        
+        for config_file in _CONFIG_FILE_NAMES:
+            if config_file in present:
                 try:
-                    return _load_config_file(str(config_path))
+                    return _load_config_file(str(search_dir / config_file))
                 except ConfigurationError:
                     continue
     
@@ -174,84 +263,14 @@ def _load_env_config() -> Dict[str, Any]:
     """
     config = {}
     
-    # Project configuration
-    if os.getenv('CCD_PROJECT_NAME'):
-        if 'project' not in config:
-            config['project'] = {}
-        config['project']['name'] = os.getenv('CCD_PROJECT_NAME')
-    
-    if os.getenv('CCD_PROJECT_DOMAIN'):
-        if 'project' not in config:
-            config['project'] = {}
-        config['project']['domain'] = os.getenv('CCD_PROJECT_DOMAIN')
-    
-    if os.getenv('CCD_SCHEMAS_PATH'):
-        if 'project' not in config:
-            config['project'] = {}
-        config['project']['schemas_path'] = os.getenv('CCD_SCHEMAS_PATH')
-    
-    if os.getenv('CCD_CONTEXTS_PATH'):
-        if 'project' not in config:
-            config['project'] = {}
-        config['project']['contexts_path'] = os.getenv('CCD_CONTEXTS_PATH')
-    
-    # Generation configuration
-    if os.getenv('CCD_AUTO_UPDATE'):
-        if 'generation' not in config:
-            config['generation'] = {}
-        config['generation']['auto_update'] = os.getenv('CCD_AUTO_UPDATE').lower() == 'true'
-    
-    if os.getenv('CCD_INCLUDE_TESTS'):
-        if 'generation' not in config:
-            config['generation'] = {}
-        config['generation']['include_tests'] = os.getenv('CCD_INCLUDE_TESTS').lower() == 'true'
-    
-    # Validation configuration
-    if os.getenv('CCD_STRICT_MODE'):
-        if 'validation' not in config:
-            config['validation'] = {}
-        config['validation']['strict_mode'] = os.getenv('CCD_STRICT_MODE').lower() == 'true'
-    
-    if os.getenv('CCD_FAIL_FAST'):
-        if 'validation' not in config:
-            config['validation'] = {}
-        config['validation']['fail_fast'] = os.getenv('CCD_FAIL_FAST').lower() == 'true'
-    
-    # Output configuration
-    if os.getenv('CCD_OUTPUT_FORMAT'):
-        if 'output' not in config:
-            config['output'] = {}
-        config['output']['default_format'] = os.getenv('CCD_OUTPUT_FORMAT')
-    
-    if os.getenv('CCD_COLORS'):
-        if 'output' not in config:
-            config['output'] = {}
-        config['output']['colors'] = os.getenv('CCD_COLORS').lower() == 'true'
-    
-    if os.getenv('CCD_VERBOSE'):
-        if 'output' not in config:
-            config['output'] = {}
-        config['output']['verbose'] = os.getenv('CCD_VERBOSE').lower() == 'true'
-    
-    if os.getenv('CCD_QUIET'):
-        if 'output' not in config:
-            config['output'] = {}
-        config['output']['quiet'] = os.getenv('CCD_QUIET').lower() == 'true'
-    
-    # Monitoring configuration
-    if os.getenv('CCD_WATCH_INTERVAL'):
-        if 'monitoring' not in config:
-            config['monitoring'] = {}
-        try:
-            config['monitoring']['watch_interval'] = int(os.getenv('CCD_WATCH_INTERVAL'))
-        except ValueError:
-            pass
-    
-    if os.getenv('CCD_COVERAGE_THRESHOLD'):
-        if 'monitoring' not in config:
-            config['monitoring'] = {}
+    for env_name, section, key, parse in _ENV_SETTINGS:
+        value = os.getenv(env_name)
+        if not value:
+            continue
+        
+        target = config.setdefault(section, {})
         try:
-            config['monitoring']['coverage_threshold'] = int(os.getenv('CCD_COVERAGE_THRESHOLD'))
+            target[key] = parse(value)
         except ValueError:
             pass
     
@@ -269,16 +288,22 @@ def _merge_configs(default: Dict[str, Any], override: Dict[str, Any]) -> Dict[st
     Returns:
         Merged configuration
     """
-    result = default.copy()
+    result = dict(default)
     
-    def _merge_dict(target: Dict[str, Any], source: Dict[str, Any]):
+    # Walk nested sections with an explicit stack; a section from default is
+    # copied only when override writes into it, so default is never mutated
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
         for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                _merge_dict(target[key], value)
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = dict(current)
+                target[key] = merged
+                stack.append((merged, value))
             else:
                 target[key] = value
     
-    _merge_dict(result, override)
     return result
 
 
@@ -298,29 +323,34 @@ def save_config(config: Dict[str, Any], config_path: str) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False, indent=2)
+            yaml.dump(config, f, Dumper=Dumper, default_flow_style=False, sort_keys=False, indent=2)
             
     except Exception as e:
         raise ConfigurationError(f"Failed to save configuration: {config_path}", str(e))
 
 
-def validate_config(config: Dict[str, Any]) -> list:
+def validate_config(config: Dict[str, Any], fail_fast: bool = False) -> list:
     """
     Validate configuration structure and values.
     
     Args:
         config: Configuration dictionary
+        fail_fast: Stop at the first error instead of collecting all of them
         
     Returns:
         List of validation errors
     """
-    errors = []
-    
+    errors = _iter_config_errors(config)
+    return list(itertools.islice(errors, 1) if fail_fast else errors)
+
+
+def _iter_config_errors(config: Dict[str, Any]) -> Iterator[str]:
+    """Yield configuration errors lazily, in report order."""
     # Check required sections
     required_sections = ['project', 'generation', 'validation', 'output']
     for section in required_sections:
         if section not in config:
-            errors.append(f"Missing required configuration section: {section}")
+            yield f"Missing required configuration section: {section}"
     
     # Validate project section
     if 'project' in config:
@@ -328,12 +358,12 @@ def validate_config(config: Dict[str, Any]) -> list:
         if 'schemas_path' in project:
             schemas_path = Path(project['schemas_path'])
             if not schemas_path.exists():
-                errors.append(f"Schemas path does not exist: {schemas_path}")
+                yield f"Schemas path does not exist: {schemas_path}"
         
         if 'contexts_path' in project:
             contexts_path = Path(project['contexts_path'])
             if not contexts_path.exists():
-                errors.append(f"Contexts path does not exist: {contexts_path}")
+                yield f"Contexts path does not exist: {contexts_path}"
     
     # Validate generation section
     if 'generation' in config:
@@ -341,7 +371,7 @@ def validate_config(config: Dict[str, Any]) -> list:
         if 'max_file_size' in generation:
             max_size = generation['max_file_size']
             if not isinstance(max_size, str) or not _is_valid_size_string(max_size):
-                errors.append(f"Invalid max_file_size format: {max_size}")
+                yield f"Invalid max_file_size format: {max_size}"
     
     # Validate validation section
     if 'validation' in config:
@@ -349,7 +379,7 @@ def validate_config(config: Dict[str, Any]) -> list:
         if 'max_errors' in validation:
             max_errors = validation['max_errors']
             if not isinstance(max_errors, int) or max_errors < 1:
-                errors.append(f"max_errors must be a positive integer: {max_errors}")
+                yield f"max_errors must be a positive integer: {max_errors}"
     
     # Validate output section
     if 'output' in config:
@@ -357,7 +387,7 @@ def validate_config(config: Dict[str, Any]) -> list:
         if 'default_format' in output:
             valid_formats = ['text', 'json', 'yaml']
             if output['default_format'] not in valid_formats:
-                errors.append(f"Invalid output format: {output['default_format']}. Must be one of: {valid_formats}")
+                yield f"Invalid output format: {output['default_format']}. Must be one of: {valid_formats}"
     
     # Validate monitoring section
     if 'monitoring' in config:
@@ -365,14 +395,12 @@ def validate_config(config: Dict[str, Any]) -> list:
         if 'coverage_threshold' in monitoring:
             threshold = monitoring['coverage_threshold']
             if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 100:
-                errors.append(f"coverage_threshold must be between 0 and 100: {threshold}")
+                yield f"coverage_threshold must be between 0 and 100: {threshold}"
         
         if 'freshness_threshold' in monitoring:
             threshold = monitoring['freshness_threshold']
             if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 100:
-                errors.append(f"freshness_threshold must be between 0 and 100: {threshold}")
-    
-    return errors
+                yield f"freshness_threshold must be between 0 and 100: {threshold}"
 
 
 def _is_valid_size_string(size_str: str) -> bool:
@@ -385,8 +413,4 @@ def _is_valid_size_string(size_str: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    import re
-    
-    # Pattern: number followed by optional decimal and unit
-    pattern = r'^\d+(\.\d+)?\s*(B|KB|MB|GB|TB)$'
-    return bool(re.match(pattern, size_str.upper()))
+    return _SIZE_RE.match(size_str.upper()) is not None
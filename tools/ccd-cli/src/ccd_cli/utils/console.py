@@ -0,0 +1,21 @@
+"""
+Console Utilities
+
+Shared Rich console for CCD CLI output.
+"""
+
+from rich.console import Console
+from rich.theme import Theme
+
+# Named styles for table columns, resolved by theme lookup instead of
+# parsing a style string for every column
+THEME = Theme({
+    "ccd.header": "bold magenta",
+    "ccd.component": "cyan",
+    "ccd.description": "white",
+    "ccd.path": "green",
+})
+
+# Automatic highlighting is disabled: output is already marked up explicitly,
+# and the highlighter would otherwise run its regexes over every printed string
+console = Console(highlight=False, theme=THEME)
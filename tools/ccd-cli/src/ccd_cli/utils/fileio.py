@@ -0,0 +1,66 @@
+"""
+File I/O Utilities
+
+Helpers for reading and writing project files with few syscalls.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def read_bytes(file_path: Path) -> bytes:
+    """Read a whole file with one fstat() and a read() sized to fit it."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        # One byte more than the reported size, so a file of reported size 0
+        # (as in /proc) is still read
+        data = os.read(fd, size + 1)
+        chunk = os.read(fd, 64 * 1024) if data else b''
+        if not chunk:
+            return data
+        
+        # A short read or a file that grew after fstat(); read until EOF
+        chunks = [data, chunk]
+        while chunk := os.read(fd, 64 * 1024):
+            chunks.append(chunk)
+        return b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def json_bytes(data: dict) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def write_atomic(file_path: Path, data: bytes) -> None:
+    """Write a file via a uniquely named temporary sibling and an atomic rename."""
+    mode = file_path.stat().st_mode & 0o7777 if file_path.exists() else 0o644
+    
+    # mkstemp never reuses an existing name, so concurrent writers and
+    # unrelated files next to the target are left alone
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
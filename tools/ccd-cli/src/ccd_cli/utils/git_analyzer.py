@@ -4,28 +4,155 @@ Git Analyzer
 Analyze Git repository for CCD context generation.
 """
 
+import os
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - optional speedup
+    pygit2 = None
+
+
+# Returned for files without readable history (no repository or no pygit2)
+_UNKNOWN_DATE = "2024-01-01T00:00:00Z"
+
+
+def _format_time(commit_time: int) -> str:
+    """Format a commit timestamp as an ISO 8601 UTC string."""
+    return datetime.fromtimestamp(commit_time, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
 
 
 class GitAnalyzer:
     """Analyze Git repository for CCD context generation."""
-    
+
     def __init__(self, repository_path: Path):
         """Initialize Git analyzer."""
         self.repository_path = repository_path
-    
+
+        # Repository is opened once and walked in-process via libgit2
+        self._repo = None
+        self._history: Dict[str, List[Dict[str, Any]]] = {}
+        if pygit2 is not None:
+            git_dir = pygit2.discover_repository(str(repository_path))
+            if git_dir:
+                self._repo = pygit2.Repository(git_dir)
+
+    def _relative_path(self, file_path: Path) -> Optional[str]:
+        """Get the repository-relative POSIX path of a file, or None if outside the work tree."""
+        workdir = self._repo.workdir
+        if workdir is None:
+            # Bare repositories have no work tree to resolve paths against
+            return None
+
+        # Relative paths are relative to repository_path, which may be a
+        # subdirectory of the work tree; directories are resolved so that
+        # symlinked checkouts still match the work tree path
+        path = Path(self.repository_path, file_path)
+        path = Path(os.path.realpath(path.parent), path.name)
+        try:
+            return path.relative_to(os.path.realpath(workdir)).as_posix()
+        except ValueError:
+            return None
+
+    def _file_history(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Get the commits touching a file, newest first, cached per path."""
+        if self._repo is None:
+            return []
+
+        rel_path = self._relative_path(file_path)
+        if rel_path is None:
+            return []
+
+        history = self._history.get(rel_path)
+        if history is None:
+            history = [
+                {
+                    'commit': str(commit.id),
+                    'author': commit.author.name,
+                    'email': commit.author.email,
+                    'date': _format_time(commit.commit_time),
+                    'message': commit.message.split('\n', 1)[0],
+                }
+                for commit, changed in self._iter_changes()
+                if rel_path in changed
+            ]
+            self._history[rel_path] = history
+        return history
+
+    def _iter_changes(self) -> Iterator[Tuple[Any, Set[str]]]:
+        """
+        Yield each commit with the paths it changes, newest first.
+
+        Both the per-file and the batched queries are derived from this, so
+        they agree on which commits touch a file.
+        """
+        if self._repo is None or self._repo.head_is_unborn:
+            return
+
+        for commit in self._repo.walk(self._repo.head.target, pygit2.GIT_SORT_TIME):
+            if commit.parents:
+                diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+            else:
+                diff = commit.tree.diff_to_tree(swap=True)
+            yield commit, {
+                path for delta in diff.deltas
+                for path in (delta.old_file.path, delta.new_file.path)
+            }
+
+    def _pending_paths(self, paths: List[Path]) -> Dict[str, List[Path]]:
+        """Group requested paths by their repository-relative form."""
+        pending: Dict[str, List[Path]] = {}
+        if self._repo is not None:
+            for path in paths:
+                rel_path = self._relative_path(path)
+                if rel_path is not None:
+                    pending.setdefault(rel_path, []).append(path)
+        return pending
+
     def get_file_history(self, file_path: Path) -> List[Dict[str, Any]]:
         """Get file change history."""
-        # Placeholder implementation
-        return []
-    
+        return list(self._file_history(file_path))
+
     def get_last_modified(self, file_path: Path) -> str:
         """Get last modification date."""
-        # Placeholder implementation
-        return "2024-01-01T00:00:00Z"
-    
+        history = self._file_history(file_path)
+        return history[0]['date'] if history else _UNKNOWN_DATE
+
     def get_contributors(self, file_path: Path) -> List[str]:
         """Get file contributors."""
-        # Placeholder implementation
-        return []
+        return list(dict.fromkeys(entry['email'] for entry in self._file_history(file_path)))
+
+    def get_all_last_modified(self, paths: Iterable[Path]) -> Dict[Path, str]:
+        """Get last modification dates for many files in one history walk."""
+        paths = list(paths)
+        result = dict.fromkeys(paths, _UNKNOWN_DATE)
+        pending = self._pending_paths(paths)
+        if not pending:
+            return result
+
+        for commit, changed in self._iter_changes():
+            for rel_path in pending.keys() & changed:
+                date = _format_time(commit.commit_time)
+                for path in pending.pop(rel_path):
+                    result[path] = date
+            if not pending:
+                break
+        return result
+
+    def get_all_contributors(self, paths: Iterable[Path]) -> Dict[Path, List[str]]:
+        """Get contributors for many files in one history walk."""
+        paths = list(paths)
+        pending = self._pending_paths(paths)
+        emails: Dict[str, Dict[str, None]] = {rel_path: {} for rel_path in pending}
+
+        for commit, changed in self._iter_changes():
+            for rel_path in pending.keys() & changed:
+                emails[rel_path][commit.author.email] = None
+
+        result = {path: [] for path in paths}
+        for rel_path, originals in pending.items():
+            for path in originals:
+                result[path] = list(emails[rel_path])
+        return result
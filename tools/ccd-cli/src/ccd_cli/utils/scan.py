@@ -0,0 +1,45 @@
+"""
+Project Scanning Utilities
+
+Shared settings and helpers for walking a project's source tree.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+# Source file extensions scanned by project-wide commands
+SOURCE_EXTENSIONS = frozenset(('.py', '.go', '.js', '.ts', '.java', '.cs', '.cpp', '.c', '.rs'))
+
+# Directories never walked when scanning a project (VCS metadata,
+# dependencies, caches and build output)
+IGNORED_DIRS = frozenset((
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv',
+    'dist', 'build', 'target', '.tox'
+))
+
+# Per-file work is only handed to a pool above this many files, below it
+# the pool start-up costs more than it saves
+PARALLEL_THRESHOLD = 16
+
+
+def iter_source_files(root: Path, extensions: frozenset = SOURCE_EXTENSIONS) -> Iterator[str]:
+    """
+    Walk a directory tree with os.scandir, yielding matching file paths.
+
+    Extensions are matched case-insensitively. Directories in IGNORED_DIRS
+    are not descended into.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORED_DIRS:
+                            stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
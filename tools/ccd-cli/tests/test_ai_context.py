@@ -0,0 +1,99 @@
+"""
+Test AI-CONTEXT comments functionality.
+"""
+
+import pytest
+import yaml
+from click.testing import CliRunner
+from ccd_cli.commands.ai_context import (
+    extract_ai_context_comments,
+    extract_context,
+    validate_ai_context_comments,
+    validate_context_comments,
+)
+
+
+def test_extract_ai_context_comments(tmp_path):
+    """Test extracting AI-CONTEXT comments from a source file."""
+    source = tmp_path / "main.go"
+    source.write_text(
+        "// AI-CONTEXT: @file:docs/main.go.ctx.md\n"
+        "  //AI-CONTEXT: @health:95%  \n"
+        "package main\n"
+        "// not an AI-CONTEXT: @comment:value\n",
+        encoding="utf-8",
+    )
+
+    comments = extract_ai_context_comments(source)
+    assert comments == {'file': 'docs/main.go.ctx.md', 'health': '95%'}
+
+
+def test_extract_ai_context_comments_large_file(tmp_path):
+    """Test extracting AI-CONTEXT comments from a file scanned via mmap."""
+    source = tmp_path / "large.go"
+    source.write_text(
+        "// AI-CONTEXT: @file:docs/large.go.ctx.md\r\n"
+        + "var x = 1\n" * 10000
+        + "// AI-CONTEXT: @owner:team-core\n",
+        encoding="utf-8",
+    )
+
+    comments = extract_ai_context_comments(source)
+    assert comments == {'file': 'docs/large.go.ctx.md', 'owner': 'team-core'}
+
+
+def test_extract_ai_context_comments_missing_file(tmp_path):
+    """Test extracting AI-CONTEXT comments from a missing file."""
+    with pytest.raises(FileNotFoundError):
+        extract_ai_context_comments(tmp_path / "missing.go")
+
+
+def test_extract_context_project(tmp_path):
+    """Test extracting AI-CONTEXT comments from a whole project."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.go").write_text(
+        "// AI-CONTEXT: @file:docs/main.go.ctx.md\npackage main\n", encoding="utf-8"
+    )
+    (tmp_path / "src" / "plain.py").write_text("print('no comments')\n", encoding="utf-8")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "index.js").write_text(
+        "// AI-CONTEXT: @file:vendored.ctx.md\n", encoding="utf-8"
+    )
+    output = tmp_path / "comments.yaml"
+
+    result = CliRunner().invoke(extract_context, ['--project', str(tmp_path), '--output', str(output)])
+
+    assert result.exit_code == 0, result.output
+    documents = list(yaml.safe_load_all(output.read_text(encoding="utf-8")))
+    assert documents == [{'path': str(tmp_path / "src" / "main.go"), 'file': 'docs/main.go.ctx.md'}]
+
+
+def test_validate_context_comments_project(tmp_path):
+    """Test validating AI-CONTEXT comments across a whole project."""
+    (tmp_path / "valid.go").write_text(
+        "// AI-CONTEXT: @file:valid.go.ctx.md\n"
+        "// AI-CONTEXT: @freshness:2024-01-01T00:00:00Z\n"
+        "// AI-CONTEXT: @health:95%\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "invalid.go").write_text("// AI-CONTEXT: @health:high\n", encoding="utf-8")
+
+    result = CliRunner().invoke(validate_context_comments, ['--project', str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "1/2 files have valid AI-CONTEXT comments" in result.output
+
+
+def test_validate_ai_context_comments_rejects_impossible_dates(tmp_path):
+    """Test that @freshness must be a real calendar date."""
+    source = tmp_path / "main.go"
+    source.write_text(
+        "// AI-CONTEXT: @file:main.go.ctx.md\n"
+        "// AI-CONTEXT: @freshness:2024-13-45\n"
+        "// AI-CONTEXT: @health:95%\n",
+        encoding="utf-8",
+    )
+
+    validation = validate_ai_context_comments(source)
+    assert not validation['valid']
+    assert validation['errors'] == ["Invalid freshness format: 2024-13-45"]
@@ -0,0 +1,91 @@
+"""
+Test configuration utilities.
+"""
+
+import datetime
+import json
+
+from ccd_cli.utils.config import _parse_config_file, _sidecar_path, load_config, validate_config
+
+
+def _invalid_config(tmp_path):
+    """Build a config with a missing section, a missing path and a bad format."""
+    return {
+        'project': {'schemas_path': str(tmp_path / "missing-schemas")},
+        'generation': {'max_file_size': 'huge'},
+        'output': {'default_format': 'xml'},
+    }
+
+
+def test_validate_config_reports_errors_in_order(tmp_path):
+    """Test that errors are reported section by section."""
+    errors = validate_config(_invalid_config(tmp_path))
+
+    assert errors == [
+        "Missing required configuration section: validation",
+        f"Schemas path does not exist: {tmp_path / 'missing-schemas'}",
+        "Invalid max_file_size format: huge",
+        "Invalid output format: xml. Must be one of: ['text', 'json', 'yaml']",
+    ]
+
+
+def test_validate_config_fail_fast(tmp_path):
+    """Test that fail_fast stops at the first error."""
+    config = _invalid_config(tmp_path)
+
+    assert validate_config(config, fail_fast=True) == validate_config(config)[:1]
+
+
+def _sidecar(tmp_path, monkeypatch):
+    """Point the user cache at tmp_path and return the sidecar of its config file."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    _parse_config_file.cache_clear()
+    return _sidecar_path(str(tmp_path / "ccd.config.yaml"))
+
+
+def test_config_sidecar_cache_hit(tmp_path, monkeypatch):
+    """Test that a sidecar matching the config file is used instead of the YAML."""
+    config_file = tmp_path / "ccd.config.yaml"
+    config_file.write_text("output:\n  default_format: json\n", encoding="utf-8")
+    sidecar = _sidecar(tmp_path, monkeypatch)
+
+    assert load_config(str(config_file))['output']['default_format'] == 'json'
+    cached = json.loads(sidecar.read_text(encoding="utf-8"))
+    assert cached['config'] == {'output': {'default_format': 'json'}}
+    assert sidecar.parent.parent.parent == tmp_path / "cache"
+    assert list(tmp_path.glob("*.json")) == []
+
+    # A sidecar still keyed to the file's stamp is trusted as is
+    cached['config']['output']['default_format'] = 'yaml'
+    sidecar.write_text(json.dumps(cached), encoding="utf-8")
+    _parse_config_file.cache_clear()
+    assert load_config(str(config_file))['output']['default_format'] == 'yaml'
+
+
+def test_config_sidecar_invalidated_by_edit(tmp_path, monkeypatch):
+    """Test that editing the config file replaces a stale sidecar."""
+    config_file = tmp_path / "ccd.config.yaml"
+    config_file.write_text("output:\n  default_format: json\n", encoding="utf-8")
+    sidecar = _sidecar(tmp_path, monkeypatch)
+    load_config(str(config_file))
+
+    config_file.write_text("output:\n  default_format: text\n  verbose: true\n", encoding="utf-8")
+    _parse_config_file.cache_clear()
+    config = load_config(str(config_file))
+
+    assert config['output']['default_format'] == 'text'
+    assert config['output']['verbose'] is True
+    cached = json.loads(sidecar.read_text(encoding="utf-8"))
+    assert cached['config']['output'] == {'default_format': 'text', 'verbose': True}
+
+
+def test_config_sidecar_skipped_for_dates(tmp_path, monkeypatch):
+    """Test that configs which do not survive JSON unchanged are not cached."""
+    config_file = tmp_path / "ccd.config.yaml"
+    config_file.write_text("project:\n  started: 2024-01-01\n", encoding="utf-8")
+    sidecar = _sidecar(tmp_path, monkeypatch)
+
+    config = load_config(str(config_file))
+
+    assert config['project']['started'] == datetime.date(2024, 1, 1)
+    assert not sidecar.exists()
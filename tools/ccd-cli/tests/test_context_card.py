@@ -0,0 +1,22 @@
+"""
+Test context card functionality.
+"""
+
+from ccd_cli.core.context_card import ChangelogEntry, ContextCard
+
+
+def test_context_card_changelog_from_dicts():
+    """Test rendering a changelog passed as plain dicts."""
+    card = ContextCard(
+        file_path="src/app.py",
+        last_modified="2024-01-01T00:00:00",
+        changelog=[
+            {'date': '2024-01-01', 'change': 'Initial version', 'author': 'alice'},
+            {'date': '2024-02-01', 'change': 'Add cache', 'author': 'bob', 'version': '1.1.0'},
+        ],
+    )
+
+    assert all(isinstance(entry, ChangelogEntry) for entry in card.changelog)
+    markdown = card.to_markdown()
+    assert "- **2024-01-01** - Initial version (by alice)" in markdown
+    assert "- **2024-02-01** - Add cache (by bob)\n  - Version: 1.1.0" in markdown
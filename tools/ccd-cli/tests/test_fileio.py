@@ -0,0 +1,31 @@
+"""
+Test file I/O helpers.
+"""
+
+import os
+
+from ccd_cli.utils.fileio import read_bytes, write_atomic
+
+
+def test_read_bytes_after_short_reads(tmp_path, monkeypatch):
+    """Test that a read returning fewer bytes than requested is not taken as EOF."""
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"0123456789")
+    os_read = os.read
+    monkeypatch.setattr(os, "read", lambda fd, n: os_read(fd, min(n, 3)))
+
+    assert read_bytes(target) == b"0123456789"
+
+
+def test_write_atomic_leaves_neighbours_alone(tmp_path):
+    """Test that atomic writes neither touch X.tmp nor leave temp files behind."""
+    target = tmp_path / "report.json"
+    neighbour = tmp_path / "report.json.tmp"
+    neighbour.write_text("user data", encoding="utf-8")
+
+    write_atomic(target, b"first")
+    write_atomic(target, b"second")
+
+    assert target.read_bytes() == b"second"
+    assert neighbour.read_text(encoding="utf-8") == "user data"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["report.json", "report.json.tmp"]
@@ -0,0 +1,90 @@
+"""
+Test Git analyzer functionality.
+"""
+
+import os
+
+import pytest
+
+from ccd_cli.utils.git_analyzer import GitAnalyzer
+
+pygit2 = pytest.importorskip("pygit2")
+
+
+def _commit(repo, files, email, when, message):
+    """Write files (None deletes) and commit them with a fixed author and time."""
+    workdir = repo.workdir
+    for name, content in files.items():
+        path = f"{workdir}/{name}"
+        if content is None:
+            repo.index.remove(name)
+            os.remove(path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            repo.index.add(name)
+    repo.index.write()
+    tree = repo.index.write_tree()
+    signature = pygit2.Signature(email.split("@")[0], email, when, 0)
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    repo.create_commit("HEAD", signature, signature, message, tree, parents)
+
+
+@pytest.fixture
+def repo_path(tmp_path):
+    """Create a repository with a short, time-ordered history."""
+    repo = pygit2.init_repository(str(tmp_path))
+    _commit(repo, {"src/app.py": "1\n", "README.md": "1\n"}, "alice@example.com", 1_700_000_000, "one")
+    _commit(repo, {"README.md": "2\n"}, "bob@example.com", 1_700_003_600, "two")
+    _commit(repo, {"src/app.py": "3\n"}, "carol@example.com", 1_700_007_200, "three")
+    _commit(repo, {"README.md": None}, "alice@example.com", 1_700_010_800, "four")
+    return tmp_path
+
+
+def test_git_analyzer_file_history(repo_path):
+    """Test per-file history queries for relative and absolute paths."""
+    analyzer = GitAnalyzer(repo_path)
+
+    assert [entry['message'] for entry in analyzer.get_file_history("README.md")] == ["four", "two", "one"]
+    assert analyzer.get_last_modified("src/app.py") == "2023-11-15T00:13:20Z"
+    assert analyzer.get_contributors(repo_path / "src" / "app.py") == ["carol@example.com", "alice@example.com"]
+    assert analyzer.get_file_history("missing.py") == []
+
+
+def test_git_analyzer_subdirectory_paths(repo_path):
+    """Test that relative paths resolve against a subdirectory repository_path."""
+    analyzer = GitAnalyzer(repo_path / "src")
+
+    assert analyzer.get_contributors("app.py") == ["carol@example.com", "alice@example.com"]
+    assert analyzer.get_file_history("README.md") == []
+
+
+def test_git_analyzer_bare_repository(tmp_path):
+    """Test that a bare repository yields no history instead of failing."""
+    pygit2.init_repository(str(tmp_path), bare=True)
+    analyzer = GitAnalyzer(tmp_path)
+
+    assert analyzer.get_file_history("app.py") == []
+    assert analyzer.get_last_modified("app.py") == "2024-01-01T00:00:00Z"
+
+
+def test_git_analyzer_batched_queries_match_per_file(repo_path):
+    """Test that batched queries agree with the per-file ones."""
+    repo = pygit2.Repository(str(repo_path))
+    # Mode-only change: same blob, different file mode
+    entry = repo.index["src/app.py"]
+    repo.index.add(pygit2.IndexEntry("src/app.py", entry.id, pygit2.GIT_FILEMODE_BLOB_EXECUTABLE))
+    repo.index.write()
+    signature = pygit2.Signature("dave", "dave@example.com", 1_700_014_400, 0)
+    repo.create_commit("HEAD", signature, signature, "five", repo.index.write_tree(), [repo.head.target])
+
+    analyzer = GitAnalyzer(repo_path)
+    paths = ["src/app.py", "README.md", repo_path / "src" / "app.py", "missing.py"]
+
+    last_modified = analyzer.get_all_last_modified(paths)
+    contributors = analyzer.get_all_contributors(paths)
+    for path in paths:
+        assert last_modified[path] == analyzer.get_last_modified(path)
+        assert contributors[path] == analyzer.get_contributors(path)
+    assert contributors["src/app.py"][0] == "dave@example.com"
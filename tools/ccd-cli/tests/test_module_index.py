@@ -0,0 +1,16 @@
+"""
+Test module index functionality.
+"""
+
+from ccd_cli.core.module_index import ModuleIndex
+
+
+def test_module_index_validate_fail_fast():
+    """Test that fail_fast stops at the first validation error."""
+    index = ModuleIndex("src/app", "library", "")
+    index.files.append({"path": "src/app/a.py"})
+
+    errors = index.validate()
+    assert errors[0] == "Module purpose is required"
+    assert "File 0: type is required" in errors
+    assert index.validate(fail_fast=True) == ["Module purpose is required"]
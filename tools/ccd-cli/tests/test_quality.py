@@ -0,0 +1,81 @@
+"""
+Test quality gate functionality.
+"""
+
+import json
+
+from ccd_cli.commands.quality import (
+    CONTEXT_CARD_SCHEMA,
+    check_schema_validation_gate,
+    check_single_file_drift,
+)
+
+
+CARD_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["file_path", "updated_at"],
+    "properties": {
+        "file_path": {"type": "string"},
+        "updated_at": {"type": "string"},
+    },
+}
+
+
+def _write_project(tmp_path, schema_text):
+    """Create a project with one valid and one invalid context card."""
+    schema_path = tmp_path / CONTEXT_CARD_SCHEMA
+    schema_path.parent.mkdir(parents=True)
+    schema_path.write_text(schema_text, encoding="utf-8")
+
+    cards = tmp_path / "docs" / "context-cards"
+    cards.mkdir(parents=True)
+    (cards / "valid.ctx.md").write_text(
+        '---\nfile_path: "src/valid.py"\nupdated_at: 2024-01-01\n---\n# valid.py\n',
+        encoding="utf-8",
+    )
+    (cards / "invalid.ctx.md").write_text(
+        '---\nupdated_at: 2024-01-01\n---\n# invalid.py\n',
+        encoding="utf-8",
+    )
+
+
+def test_schema_validation_gate(tmp_path):
+    """Test counting cards whose frontmatter matches the schema."""
+    _write_project(tmp_path, json.dumps(CARD_SCHEMA))
+
+    gate = check_schema_validation_gate(tmp_path)
+    assert gate['details']['valid_files'] == 1
+    assert gate['details']['total_files'] == 2
+    assert gate['metric'] == '50.0%'
+
+
+def test_schema_validation_gate_broken_schema(tmp_path):
+    """Test that a malformed, invalid or unreadable schema fails only the gate."""
+    _write_project(tmp_path, "{not json")
+    gate = check_schema_validation_gate(tmp_path)
+    assert gate['score'] == 0
+    assert gate['details']['note'].startswith('Invalid context card schema')
+
+    (tmp_path / CONTEXT_CARD_SCHEMA).write_text(json.dumps({"type": 12}), encoding="utf-8")
+    gate = check_schema_validation_gate(tmp_path)
+    assert gate['score'] == 0
+    assert gate['details']['note'].startswith('Invalid context card schema')
+
+    # A schema path that cannot be read as a file fails the gate the same way
+    schema_path = tmp_path / CONTEXT_CARD_SCHEMA
+    schema_path.unlink()
+    schema_path.mkdir()
+    gate = check_schema_validation_gate(tmp_path)
+    assert gate['score'] == 0
+    assert gate['details']['note'].startswith('Invalid context card schema')
+
+
+def test_single_file_drift_source_under_a_file(tmp_path):
+    """Test that a source path running through a regular file counts as missing."""
+    (tmp_path / "src").write_text("not a directory", encoding="utf-8")
+    card = tmp_path / "main.ctx.md"
+    card.write_text('---\nfile_path: "src/main.py"\n---\n', encoding="utf-8")
+
+    drift = check_single_file_drift(card, tmp_path)
+    assert drift['drift_type'] == 'source_file_missing'